@@ -6,12 +6,33 @@ Provides:
 2. Migration Execution: Run migrations from field_mappings.json (v1.2.0+)
 """
 
-__version__ = "1.3.6"
-__author__ = "Victoria Tarane"
+from importlib.metadata import PackageNotFoundError, version as _version
+
+try:
+    __version__ = _version("schema-migrator")
+except PackageNotFoundError:  # running from a source checkout
+    __version__ = "0.0.0"
 
-from .builder import build_diagram
-from .executor import MigrationExecutor
+__author__ = "Victoria Tarane"
 
 __all__ = ["build_diagram", "MigrationExecutor"]
 
+# Public names are resolved on first access (PEP 562) so that importing the
+# package - e.g. for ``__version__`` - doesn't pull in the builder or PyMySQL.
+_LAZY_ATTRS = {
+    "build_diagram": ".builder",
+    "MigrationExecutor": ".executor",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        from importlib import import_module
+        value = getattr(import_module(_LAZY_ATTRS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
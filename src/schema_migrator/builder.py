@@ -9,9 +9,242 @@ Usage:
     python scripts/build_diagram.py
 """
 
+import io
 import re
 import json
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import hashlib
+import mmap
 import os
+from pathlib import Path
+import pickle
+import sys
+
+try:
+    import orjson  # optional: faster mapping loads and embedded JSON serialization
+except ImportError:
+    orjson = None
+
+# One FOREIGN KEY edge; stored as a tuple and only turned into a dict for the page
+FKRelation = namedtuple('FKRelation', 'from_table from_col to_table to_col')
+
+
+class Column:
+    """
+    A parsed table column.
+    
+    Slotted rather than a dict since schemas can have many thousands of columns.
+    The migration fields (target, targets, sql, deprecated, reason) are only set
+    by merge_mappings, so they are absent on new/central schema columns.
+    """
+    __slots__ = ('name', 'type', 'pk', 'uk', 'fk', 'fk_ref', 'auto', 'source',
+                 'target', 'targets', 'sql', 'deprecated', 'reason')
+    
+    def __init__(self, name, type, pk=False, uk=False, auto=False, source=None):
+        self.name = name
+        self.type = type
+        self.pk = pk
+        self.uk = uk
+        self.fk = False
+        self.fk_ref = None
+        self.auto = auto
+        self.source = source
+    
+    def to_dict(self):
+        """Return the fields that have been set, in declaration order."""
+        return {field: getattr(self, field) for field in self.__slots__ if hasattr(self, field)}
+
+
+# Patterns used by parse_sql_schema, compiled once at import time
+_CREATE_SPLIT_RE = re.compile(r'CREATE TABLE\s+(?:IF NOT EXISTS\s+)?', re.IGNORECASE)
+_CREATE_SPLIT_BYTES_RE = re.compile(rb'CREATE TABLE\s+(?:IF NOT EXISTS\s+)?', re.IGNORECASE)
+_NAME_RE = re.compile(r'[`"]?(\w+)[`"]?\s*\(')
+_PAREN_GROUP_RE = re.compile(r'\(([^)]+)\)')
+_FK_RE = re.compile(
+    r'FOREIGN KEY\s*\([`"]?(\w+)[`"]?\)\s*REFERENCES\s*[`"]?(\w+)[`"]?\s*\([`"]?(\w+)[`"]?\)',
+    re.IGNORECASE
+)
+# Column line: name, type and (optional) the "COMMENT 'Source: ...'" text, in one match
+_COL_RE = re.compile(
+    r'[`"]?(\w+)[`"]?\s+(\w+(?:\([^)]+\))?(?:\s+UNSIGNED)?)'
+    r"(?:.*?COMMENT\s+'Source:\s*([^']+)')?",
+    re.IGNORECASE
+)
+
+# Inline column flags, found in one pass over the upper-cased line. Longer
+# alternatives come first so "PRIMARY KEY (" and "UNIQUE KEY"/"UNIQUE INDEX"
+# are told apart from an inline PRIMARY KEY / UNIQUE; the optional leading
+# space marks a standalone UNIQUE keyword.
+_COL_FLAGS_RE = re.compile(r'PRIMARY KEY \(|PRIMARY KEY| ?UNIQUE(?: KEY| INDEX)?|AUTO_INCREMENT')
+_UNIQUE_INDEX_FLAGS = frozenset(('UNIQUE KEY', ' UNIQUE KEY', 'UNIQUE INDEX', ' UNIQUE INDEX'))
+
+# Leading keyword of a CREATE TABLE body line -> kind of non-column definition.
+# These are all reserved words, so an unquoted column can never start with one.
+_LINE_KEYWORDS = {
+    'PRIMARY': 'pk',
+    'UNIQUE': 'uk',
+    'FOREIGN': 'fk',
+    'CONSTRAINT': 'fk',  # CONSTRAINT name FOREIGN KEY ...; non-FK constraints are dropped
+    'KEY': 'index',
+    'INDEX': 'index',
+    'CHECK': 'other',
+    'FULLTEXT': 'other',
+    'SPATIAL': 'other',
+}
+_KEYWORD_INITIALS = frozenset(keyword[0] for keyword in _LINE_KEYWORDS)
+
+# (substring, category) pairs checked in order by categorize_table; anything
+# unmatched (users, accounts, orders, products, ...) falls back to 'core'
+_CATEGORY_KEYWORDS = (
+    ('config', 'config'), ('setting', 'config'), ('option', 'config'), ('routing', 'config'),
+    ('job', 'jobs'), ('task', 'jobs'), ('queue', 'jobs'), ('worker', 'jobs'),
+    ('auth', 'auth'), ('login', 'auth'), ('session', 'auth'), ('token', 'auth'), ('license', 'auth'),
+    ('audit', 'logging'), ('log', 'logging'), ('event', 'logging'), ('history', 'logging'),
+    ('metric', 'metrics'), ('stat', 'metrics'), ('analytics', 'metrics'), ('report', 'metrics'),
+    ('lookup', 'lookup'), ('dictionary', 'lookup'), ('enum', 'lookup'), ('reference', 'lookup'),
+    ('temp', 'legacy'), ('deprecated', 'legacy'),
+)
+_LEGACY_PREFIXES = ('test', 'tmp')
+
+# Shared read-only default for tables/columns without a mapping entry
+_EMPTY_MAPPING = {}
+
+# Checkout root (this file is src/schema_migrator/builder.py); the default
+# input/output paths used by build_diagram() are relative to it
+_REPO_ROOT = Path(os.path.abspath(__file__)).parent.parent.parent
+_DEFAULT_OUTPUT = str(_REPO_ROOT / 'tools' / 'schema_diagram.html')
+
+# Parsed schemas are cached here between builds; bump the version whenever the
+# parser output changes so stale pickles are ignored
+_PARSE_CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+    'schema-migrator')
+_PARSE_CACHE_VERSION = 2
+
+# Below this much SQL in total, starting worker processes costs more than it saves
+_PARALLEL_PARSE_MIN_BYTES = 8 << 20
+
+
+def _find_closing_paren(text, start_idx, open_paren, close_paren):
+    """
+    Return the index of the paren closing the one at start_idx, or -1.
+    
+    Works on str and bytes alike (pass matching paren tokens); jumps between
+    parens with find() rather than visiting every character.
+    """
+    depth = 0
+    i = start_idx
+    n = len(text)
+    open_idx = text.find(open_paren, i)
+    while i < n:
+        close_idx = text.find(close_paren, i)
+        if close_idx == -1:
+            break
+        if open_idx != -1 and open_idx < close_idx:
+            depth += 1
+            i = open_idx + 1
+            open_idx = text.find(open_paren, i)
+        else:
+            depth -= 1
+            if depth == 0:
+                return close_idx
+            i = close_idx + 1
+    return -1
+
+
+def parse_sql_schema_file(path, schema_name):
+    """
+    Parse CREATE TABLE statements from a SQL file.
+    
+    The file is memory-mapped and each CREATE TABLE statement is decoded and
+    parsed on its own, so dumps that also carry data (INSERTs, comments) are
+    never loaded as one big string. Returns the same (tables, fk_relations)
+    as parse_sql_schema.
+    """
+    tables = {}
+    all_fk_relations = []
+    is_central = schema_name == 'central'
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return tables, all_fk_relations
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            matches = list(_CREATE_SPLIT_BYTES_RE.finditer(mm))
+            for idx, match in enumerate(matches):
+                start = match.end()
+                stop = matches[idx + 1].start() if idx + 1 < len(matches) else len(mm)
+                # Cut the statement right after its column list when it's balanced
+                open_idx = mm.find(b'(', start, stop)
+                if open_idx != -1:
+                    close_idx = _find_closing_paren(mm[open_idx:stop], 0, b'(', b')')
+                    if close_idx != -1:
+                        stop = open_idx + close_idx + 1
+                parsed = _parse_create_table(mm[start:stop].decode('utf-8'), schema_name, is_central, all_fk_relations)
+                if parsed is not None:
+                    tables[parsed[0]] = parsed[1]
+    return tables, all_fk_relations
+
+
+def _parse_cache_path(path, schema_name):
+    """Return the cache file for a schema file, keyed by its path, size and mtime."""
+    st = os.stat(path)
+    key = hashlib.blake2b(digest_size=16)
+    key.update(os.path.abspath(path).encode('utf-8', 'surrogateescape'))
+    key.update(f'\0{st.st_mtime_ns}\0{st.st_size}\0{schema_name}\0{_PARSE_CACHE_VERSION}'.encode())
+    return os.path.join(_PARSE_CACHE_DIR, key.hexdigest() + '.pkl')
+
+
+def parse_sql_schema_cached(path, schema_name):
+    """
+    parse_sql_schema_file, memoized on disk across runs.
+    
+    Schema files rarely change between builds, so the parsed (tables,
+    fk_relations) are pickled under ~/.cache/schema-migrator and reused while
+    the file's mtime and size are unchanged. Cache errors fall back to parsing.
+    """
+    try:
+        cache_path = _parse_cache_path(path, schema_name)
+    except OSError:
+        return parse_sql_schema_file(path, schema_name)
+    
+    try:
+        with open(cache_path, 'rb') as f:
+            return pickle.load(f)
+    except (OSError, pickle.PickleError, EOFError, AttributeError, ImportError):
+        pass
+    
+    result = parse_sql_schema_file(path, schema_name)
+    try:
+        os.makedirs(_PARSE_CACHE_DIR, exist_ok=True)
+        tmp_path = f'{cache_path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+    return result
+
+
+def _parse_schema_files(jobs, parse):
+    """
+    Run parse(path, schema_name) for each job and return the results in order.
+    
+    Parsing is CPU-bound Python, so threads wouldn't overlap; large inputs go
+    to one worker process per file instead, when there are cores to use.
+    """
+    try:
+        total_size = sum(os.path.getsize(path) for path, _ in jobs)
+    except OSError:
+        total_size = 0
+    if total_size >= _PARALLEL_PARSE_MIN_BYTES and (os.cpu_count() or 1) > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=len(jobs)) as executor:
+                return list(executor.map(parse, *zip(*jobs)))
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            pass  # no usable process pool here; parse in this process
+    return [parse(path, schema_name) for path, schema_name in jobs]
+
 
 def parse_sql_schema(sql_content, schema_name):
     """Parse CREATE TABLE statements from SQL."""
@@ -20,159 +253,138 @@ def parse_sql_schema(sql_content, schema_name):
     
     # Split by CREATE TABLE to handle each table separately
     # This is more reliable than trying to match the entire CREATE TABLE in one regex
-    parts = re.split(r'CREATE TABLE\s+(?:IF NOT EXISTS\s+)?', sql_content, flags=re.IGNORECASE)
+    parts = _CREATE_SPLIT_RE.split(sql_content)
+    
+    # Every table in the central schema gets the same category
+    is_central = schema_name == 'central'
     
     for part in parts[1:]:  # Skip first empty part
-        # Get table name
-        name_match = re.match(r'[`"]?(\w+)[`"]?\s*\(', part)
-        if not name_match:
+        parsed = _parse_create_table(part, schema_name, is_central, all_fk_relations)
+        if parsed is not None:
+            tables[parsed[0]] = parsed[1]
+    
+    return tables, all_fk_relations
+
+
+def _parse_create_table(part, schema_name, is_central, all_fk_relations):
+    """
+    Parse one CREATE TABLE statement (text after the CREATE TABLE keywords).
+    
+    Appends the table's FK relations to all_fk_relations and returns
+    (table_name, table_dict), or None when the statement has no column list.
+    """
+    # Get table name
+    name_match = _NAME_RE.match(part)
+    if not name_match:
+        return None
+    table_name = sys.intern(name_match.group(1))
+    
+    # Find the matching closing parenthesis for CREATE TABLE
+    # Count parentheses to find the right one
+    start_idx = part.find('(')
+    if start_idx == -1:
+        return None
+    
+    end_idx = _find_closing_paren(part, start_idx, '(', ')')
+    if end_idx == -1:
+        end_idx = start_idx
+    
+    body = part[start_idx+1:end_idx]
+    
+    columns = []
+    constraints = {'pk': [], 'fk': [], 'uk': []}
+    fk_references = {}  # col -> (ref_table, ref_col)
+    
+    # Upper-case the whole body once; lines stay aligned with the original
+    upper_lines = body.upper().split('\n')
+    
+    # Split by lines and parse each
+    for line, upper in zip(body.split('\n'), upper_lines):
+        line = line.strip()
+        if not line:
             continue
-        table_name = name_match.group(1)
         
-        # Find the matching closing parenthesis for CREATE TABLE
-        # Count parentheses to find the right one
-        start_idx = part.find('(')
-        if start_idx == -1:
+        # Remove trailing comma
+        line = line.rstrip(',')
+        upper = upper.strip().rstrip(',')
+        
+        # Classify non-column definitions by their leading keyword
+        # (column lines usually start with a backtick, so skip the lookup)
+        kind = _LINE_KEYWORDS.get(upper.partition(' ')[0]) if upper[:1] in _KEYWORD_INITIALS else None
+        
+        # Handle PRIMARY KEY constraint
+        if kind == 'pk':
+            pk_match = _PAREN_GROUP_RE.search(line)
+            if pk_match:
+                constraints['pk'] = [c.strip().strip('`"') for c in pk_match.group(1).split(',')]
             continue
         
-        depth = 0
-        end_idx = start_idx
-        for i, char in enumerate(part[start_idx:], start_idx):
-            if char == '(':
-                depth += 1
-            elif char == ')':
-                depth -= 1
-                if depth == 0:
-                    end_idx = i
-                    break
+        # Handle UNIQUE KEY constraint
+        if kind == 'uk':
+            uk_match = _PAREN_GROUP_RE.search(line)
+            if uk_match:
+                for c in uk_match.group(1).split(','):
+                    col = c.strip().strip('`"').split('(')[0]  # Handle key length like varchar(255)
+                    if col and col not in constraints['uk']:
+                        constraints['uk'].append(col)
+            continue
         
-        body = part[start_idx+1:end_idx]
+        # Handle FOREIGN KEY / CONSTRAINT - capture the reference
+        # (_FK_RE searches, so a leading "CONSTRAINT name" is skipped)
+        if kind == 'fk':
+            fk_match = _FK_RE.search(line)
+            if fk_match:
+                fk_col = sys.intern(fk_match.group(1))
+                ref_table = sys.intern(fk_match.group(2))
+                ref_col = sys.intern(fk_match.group(3))
+                constraints['fk'].append(fk_col)
+                fk_references[fk_col] = (ref_table, ref_col)
+                all_fk_relations.append(FKRelation(table_name, fk_col, ref_table, ref_col))
+            continue
         
-        columns = []
-        constraints = {'pk': [], 'fk': [], 'uk': []}
-        fk_references = {}  # col -> (ref_table, ref_col)
+        # Handle KEY/INDEX and other non-column lines
+        if kind is not None:
+            continue
         
-        # Split by lines and parse each
-        for line in body.split('\n'):
-            line = line.strip()
-            if not line:
-                continue
-            
-            # Remove trailing comma
-            line = line.rstrip(',')
-            
-            upper = line.upper()
-            
-            # Handle PRIMARY KEY constraint
-            if upper.startswith('PRIMARY KEY'):
-                pk_match = re.search(r'\(([^)]+)\)', line)
-                if pk_match:
-                    constraints['pk'] = [c.strip().strip('`"') for c in pk_match.group(1).split(',')]
-                continue
-            
-            # Handle UNIQUE KEY constraint
-            if upper.startswith('UNIQUE KEY') or upper.startswith('UNIQUE INDEX') or upper.startswith('UNIQUE ('):
-                uk_match = re.search(r'\(([^)]+)\)', line)
-                if uk_match:
-                    for c in uk_match.group(1).split(','):
-                        col = c.strip().strip('`"').split('(')[0]  # Handle key length like varchar(255)
-                        if col and col not in constraints['uk']:
-                            constraints['uk'].append(col)
-                continue
-            
-            # Handle KEY/INDEX
-            if upper.startswith('KEY ') or upper.startswith('INDEX '):
-                continue
+        # Parse column definition
+        # Match: `column_name` type...
+        col_match = _COL_RE.match(line)
+        if col_match:
+            # Names and types repeat across tables ("id", "int(11)"), so
+            # share one string object for each distinct value
+            col_name = sys.intern(col_match.group(1))
+            col_type = sys.intern(col_match.group(2).lower())
             
-            # Handle FOREIGN KEY - capture the reference
-            if upper.startswith('FOREIGN KEY'):
-                fk_match = re.search(
-                    r'FOREIGN KEY\s*\([`"]?(\w+)[`"]?\)\s*REFERENCES\s*[`"]?(\w+)[`"]?\s*\([`"]?(\w+)[`"]?\)',
-                    line, re.IGNORECASE
-                )
-                if fk_match:
-                    fk_col = fk_match.group(1)
-                    ref_table = fk_match.group(2)
-                    ref_col = fk_match.group(3)
-                    constraints['fk'].append(fk_col)
-                    fk_references[fk_col] = (ref_table, ref_col)
-                    all_fk_relations.append({
-                        'from_table': table_name,
-                        'from_col': fk_col,
-                        'to_table': ref_table,
-                        'to_col': ref_col
-                    })
-                continue
-            
-            # Handle CONSTRAINT
-            if upper.startswith('CONSTRAINT'):
-                # Also check for FK in CONSTRAINT lines
-                fk_match = re.search(
-                    r'FOREIGN KEY\s*\([`"]?(\w+)[`"]?\)\s*REFERENCES\s*[`"]?(\w+)[`"]?\s*\([`"]?(\w+)[`"]?\)',
-                    line, re.IGNORECASE
-                )
-                if fk_match:
-                    fk_col = fk_match.group(1)
-                    ref_table = fk_match.group(2)
-                    ref_col = fk_match.group(3)
-                    constraints['fk'].append(fk_col)
-                    fk_references[fk_col] = (ref_table, ref_col)
-                    all_fk_relations.append({
-                        'from_table': table_name,
-                        'from_col': fk_col,
-                        'to_table': ref_table,
-                        'to_col': ref_col
-                    })
-                continue
+            # Check for inline PRIMARY KEY
+            flags = set(_COL_FLAGS_RE.findall(upper))
+            is_pk = 'PRIMARY KEY' in flags and 'PRIMARY KEY (' not in flags
+            is_uk = ' UNIQUE' in flags and flags.isdisjoint(_UNIQUE_INDEX_FLAGS)
+            is_auto = 'AUTO_INCREMENT' in flags
             
-            # Handle other non-column lines
-            if upper.startswith(('CHECK', 'FULLTEXT', 'SPATIAL')):
-                continue
+            # Source comment if present (captured by the same match)
+            source = col_match.group(3)
+            if source is not None:
+                source = source.strip()
             
-            # Parse column definition
-            # Match: `column_name` type...
-            col_match = re.match(r'[`"]?(\w+)[`"]?\s+(\w+(?:\([^)]+\))?(?:\s+UNSIGNED)?)', line, re.IGNORECASE)
-            if col_match:
-                col_name = col_match.group(1)
-                col_type = col_match.group(2).lower()
-                
-                # Check for inline PRIMARY KEY
-                is_pk = 'PRIMARY KEY' in upper and 'PRIMARY KEY (' not in upper
-                is_uk = ' UNIQUE' in upper and 'UNIQUE KEY' not in upper and 'UNIQUE INDEX' not in upper
-                is_auto = 'AUTO_INCREMENT' in upper
-                
-                # Extract source comment if present
-                source = None
-                source_match = re.search(r"COMMENT\s+'Source:\s*([^']+)'", line, re.IGNORECASE)
-                if source_match:
-                    source = source_match.group(1).strip()
-                
-                columns.append({
-                    'name': col_name,
-                    'type': col_type,
-                    'pk': is_pk,
-                    'uk': is_uk,
-                    'fk': False,
-                    'fk_ref': None,
-                    'auto': is_auto,
-                    'source': source
-                })
-        
-        # Apply constraints to columns
-        for col in columns:
-            if col['name'] in constraints['pk']:
-                col['pk'] = True
-            if col['name'] in constraints['uk']:
-                col['uk'] = True
-            if col['name'] in constraints['fk']:
-                col['fk'] = True
-                if col['name'] in fk_references:
-                    col['fk_ref'] = fk_references[col['name']]
-        
-        category = categorize_table(table_name, schema_name)
-        tables[table_name] = {'columns': columns, 'category': category, 'schema': schema_name}
-    
-    return tables, all_fk_relations
+            columns.append(Column(col_name, col_type, is_pk, is_uk, is_auto, source))
+    
+    # Apply constraints to columns (sets for O(1) membership tests)
+    pk_set = set(constraints['pk'])
+    uk_set = set(constraints['uk'])
+    fk_set = set(constraints['fk'])
+    for col in columns:
+        col_name = col.name
+        if col_name in pk_set:
+            col.pk = True
+        if col_name in uk_set:
+            col.uk = True
+        if col_name in fk_set:
+            col.fk = True
+            if col_name in fk_references:
+                col.fk_ref = fk_references[col_name]
+    
+    category = 'central' if is_central else categorize_table(table_name, schema_name)
+    return table_name, {'columns': columns, 'category': category, 'schema': schema_name}
 
 
 def categorize_table(table_name, schema_name):
@@ -180,33 +392,16 @@ def categorize_table(table_name, schema_name):
     Categorize tables by name patterns.
     Returns category for color-coding in diagram.
     """
-    name = table_name.lower()
     if schema_name == 'central':
         return 'central'
+    name = table_name.lower()
     
-    # Pattern-based categorization
-    if 'config' in name or 'setting' in name or 'option' in name or 'routing' in name:
-        return 'config'
-    elif 'job' in name or 'task' in name or 'queue' in name or 'worker' in name:
-        return 'jobs'
-    elif 'auth' in name or 'login' in name or 'session' in name or 'token' in name or 'license' in name:
-        return 'auth'
-    elif 'audit' in name or 'log' in name or 'event' in name or 'history' in name:
-        return 'logging'
-    elif 'metric' in name or 'stat' in name or 'analytics' in name or 'report' in name:
-        return 'metrics'
-    elif 'lookup' in name or 'dictionary' in name or 'enum' in name or 'reference' in name:
-        return 'lookup'
-    elif name.startswith('test') or name.startswith('tmp') or 'temp' in name or 'deprecated' in name:
+    # Pattern-based categorization - first matching keyword wins
+    for keyword, category in _CATEGORY_KEYWORDS:
+        if keyword in name:
+            return category
+    if name.startswith(_LEGACY_PREFIXES):
         return 'legacy'
-    elif name in ('users', 'accounts', 'customers', 'clients', 'tenants', 'sites', 'organizations'):
-        return 'core'
-    elif 'user' in name or 'account' in name or 'customer' in name or 'profile' in name:
-        return 'core'
-    elif 'order' in name or 'payment' in name or 'transaction' in name or 'invoice' in name:
-        return 'core'
-    elif 'product' in name or 'inventory' in name or 'catalog' in name or 'item' in name:
-        return 'core'
     
     return 'core'  # Default
 
@@ -214,51 +409,55 @@ def categorize_table(table_name, schema_name):
 def merge_mappings(old_tables, mappings, deprecated_tables):
     """Add migration target and SQL info to old schema columns. Supports multi-target mappings."""
     for table_name, table_data in old_tables.items():
-        table_mappings = mappings.get(table_name, {})
+        table_mappings = mappings.get(table_name, _EMPTY_MAPPING)
         
         # Check if entire table is deprecated
         if table_name in deprecated_tables:
+            reason = deprecated_tables[table_name]
             for col in table_data['columns']:
-                col['target'] = None
-                col['targets'] = []
-                col['deprecated'] = True
-                col['reason'] = deprecated_tables[table_name]
-                col['sql'] = None
+                col.target = None
+                col.targets = []
+                col.deprecated = True
+                col.reason = reason
+                col.sql = None
             continue
         
+        # Table has some mappings, so unmapped columns need review
+        has_mappings = bool(table_mappings)
+        
         for col in table_data['columns']:
-            col_mapping = table_mappings.get(col['name'], {})
+            col_mapping = table_mappings.get(col.name, _EMPTY_MAPPING)
+            targets = col_mapping.get('targets')
             
             # Handle new multi-target format
-            if 'targets' in col_mapping:
+            if targets is not None:
                 # Filter out targets marked as hidden from diagram
-                visible_targets = [t for t in col_mapping['targets'] if t.get('display_in_diagram') is not False]
-                col['targets'] = visible_targets
+                visible_targets = [t for t in targets if t.get('display_in_diagram') is not False]
+                col.targets = visible_targets
                 # For backward compatibility, set 'target' to first visible target's full path
                 if visible_targets:
                     first_target = visible_targets[0]
-                    col['target'] = f"{first_target.get('table', '')}.{first_target.get('column', '')}"
+                    col.target = f"{first_target.get('table', '')}.{first_target.get('column', '')}"
                 else:
-                    col['target'] = None
-                col['sql'] = '; '.join(t.get('sql', '') for t in visible_targets if t.get('sql'))
+                    col.target = None
+                col.sql = '; '.join(t.get('sql', '') for t in visible_targets if t.get('sql'))
             # Handle old single-target format (backward compatible)
             elif 'target' in col_mapping:
-                col['target'] = col_mapping.get('target')
-                col['targets'] = []
-                col['sql'] = col_mapping.get('sql')
+                col.target = col_mapping['target']
+                col.targets = []
+                col.sql = col_mapping.get('sql')
             else:
-                col['target'] = None
-                col['targets'] = []
-                col['sql'] = None
+                col.target = None
+                col.targets = []
+                col.sql = None
             
-            col['deprecated'] = col_mapping.get('deprecated', False)
-            col['reason'] = col_mapping.get('reason')
+            col.deprecated = col_mapping.get('deprecated', False)
+            col.reason = col_mapping.get('reason')
             
             # If no mapping defined at all, mark as needing review
-            if not col['target'] and not col['targets'] and not col['deprecated'] and table_name not in deprecated_tables:
-                if table_mappings:  # Table has some mappings but this column doesn't
-                    col['deprecated'] = True
-                    col['reason'] = 'No mapping defined - review needed'
+            if has_mappings and not col.deprecated and not col.target and not col.targets:
+                col.deprecated = True
+                col.reason = 'No mapping defined - review needed'
     
     return old_tables
 
@@ -350,21 +549,23 @@ def generate_reverse_mappings(mappings):
                     'tenant_config' in new_table):
                     schema_type = 'central'
                 
-                # Initialize reverse mapping structure
-                if new_table not in reverse_map[schema_type]:
-                    reverse_map[schema_type][new_table] = {
+                # Initialize reverse mapping structure (looked up once per target)
+                entry = reverse_map[schema_type].get(new_table)
+                if entry is None:
+                    entry = reverse_map[schema_type][new_table] = {
                         'sources': set(),
                         'fields': {}
                     }
                 
                 # Add source table
-                reverse_map[schema_type][new_table]['sources'].add(old_table)
+                entry['sources'].add(old_table)
                 
                 # Add field mapping
-                if new_field not in reverse_map[schema_type][new_table]['fields']:
-                    reverse_map[schema_type][new_table]['fields'][new_field] = []
+                field_sources = entry['fields'].get(new_field)
+                if field_sources is None:
+                    field_sources = entry['fields'][new_field] = []
                 
-                reverse_map[schema_type][new_table]['fields'][new_field].append({
+                field_sources.append({
                     'old_table': old_table,
                     'old_field': old_field,
                     'sql': mapping.get('sql'),
@@ -389,34 +590,17 @@ def generate_reverse_mappings(mappings):
                     reverse_map[schema_type_key][new_table]['sources'].add(old_table)
 
     # Convert sets to sorted lists
-    for schema_type in reverse_map:
-        for table in reverse_map[schema_type]:
-            if isinstance(reverse_map[schema_type][table]['sources'], set):
-                reverse_map[schema_type][table]['sources'] = sorted(list(reverse_map[schema_type][table]['sources']))
+    for schema_tables in reverse_map.values():
+        for entry in schema_tables.values():
+            if isinstance(entry['sources'], set):
+                entry['sources'] = sorted(entry['sources'])
     
     return reverse_map
 
 
-def generate_html(old_tables, new_tables, central_tables, old_fk_relations, new_fk_relations, central_fk_relations, reverse_mappings=None, github_repo=None):
-    """Generate the complete HTML file with bidirectional relationship support."""
-    
-    all_data = {
-        'old': old_tables,
-        'new': new_tables,
-        'central': central_tables
-    }
-    
-    all_fk = {
-        'old': old_fk_relations,
-        'new': new_fk_relations,
-        'central': central_fk_relations
-    }
-    
-    # Add reverse mappings for bidirectional navigation
-    if reverse_mappings is None:
-        reverse_mappings = {'tenant': {}, 'central': {}}
-    
-    html = '''<!DOCTYPE html>
+# The diagram page, split around the three embedded JSON payloads that
+# _write_html interleaves between these chunks.
+_HTML_HEAD = '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -460,6 +644,7 @@ def generate_html(old_tables, new_tables, central_tables, old_fk_relations, new_
         .comparison-table th { background: var(--hover); padding: 6px 8px; text-align: left; font-weight: 600; border-bottom: 2px solid var(--border); position: sticky; top: 0; z-index: 10; word-wrap: break-word; }
         .comparison-table td { padding: 6px 8px; border-bottom: 1px solid var(--border); vertical-align: top; word-wrap: break-word; overflow-wrap: break-word; }
         .comparison-table tr:hover { background: var(--hover); }
+        .comparison-table tr.selected { background: rgba(88,166,255,0.15); }
         .comparison-table .col-name { font-family: 'Courier New', monospace; font-weight: 500; color: var(--blue); word-break: break-word; }
         .comparison-table .col-type { color: var(--dim); font-size: 9px; margin-left: 5px; display: block; margin-top: 2px; }
         .comparison-table .col-badges { display: flex; gap: 3px; margin-top: 2px; flex-wrap: wrap; }
@@ -609,11 +794,39 @@ def generate_html(old_tables, new_tables, central_tables, old_fk_relations, new_
     </div>
 
 <script>
-const schemaData = ''' + json.dumps(all_data, indent=2) + ''';
+const schemaData = '''
+
+_HTML_BEFORE_FK_RELATIONS = ''';
+
+const fkRelations = '''
 
-const fkRelations = ''' + json.dumps(all_fk, indent=2) + ''';
+_HTML_BEFORE_REVERSE_MAPPINGS = ''';
 
-const reverseMappings = ''' + json.dumps(reverse_mappings, indent=2) + ''';
+const reverseMappings = '''
+
+_HTML_TAIL = ''';
+
+// Columns arrive as one array per field (booleans packed into 'flags');
+// turn each table's columns back into the objects the rest of the page uses
+const COLUMN_FLAG_BITS = { pk: 1, uk: 2, fk: 4, auto: 8, deprecated: 16 };
+function expandColumns(packed) {
+    const { keys, flags } = packed;
+    const columns = new Array(flags.length);
+    for (let i = 0; i < flags.length; i++) {
+        const col = {};
+        for (const key of keys) {
+            const bit = COLUMN_FLAG_BITS[key];
+            col[key] = bit === undefined ? packed[key][i] : (flags[i] & bit) !== 0;
+        }
+        columns[i] = col;
+    }
+    return columns;
+}
+Object.values(schemaData).forEach(schema => {
+    Object.values(schema).forEach(table => {
+        if (table.columns && !Array.isArray(table.columns)) table.columns = expandColumns(table.columns);
+    });
+});
 
 const categories = {
     core: { name: 'Core', color: 'core' },
@@ -638,43 +851,104 @@ let draggedArrowId = null;
 let customArrowPaths = {}; // Store custom arrow paths
 let mouseDownPos = null; // Track where mouse was pressed
 let hasMoved = false; // Track if mouse has moved
+const layoutCache = {}; // Per view, last layoutTables result: { tables, positions }
+let draggedNode = null; // <g> of the table being dragged
+let draggedSvgRect = null; // SVG bounding rect, read once per drag
+let pendingDragPos = null; // Latest drag position, applied on the next frame
+let dragFrame = null;
+
+// Shared fallback so a missing view still yields a stable object (layoutCache
+// keys on schema identity)
+const EMPTY_SCHEMA = Object.freeze({});
+function getSchema() { return schemaData[currentView] || EMPTY_SCHEMA; }
 
-function getSchema() { return schemaData[currentView] || {}; }
+// Coordinates are written with at most one decimal to keep the SVG markup short
+// (layout math can produce values like 712.4999999807036)
+function round1(n) { return Math.round(n * 10) / 10; }
 
-function loadSavedPositions() {
-    try {
-        const saved = localStorage.getItem(`schema-positions-${currentView}`);
-        return saved ? JSON.parse(saved) : {};
-    } catch (e) {
-        console.error('Failed to load saved positions:', e);
-        return {};
+// Per-table column lookup by name, built the first time a table is asked for
+const columnIndex = new WeakMap();
+function getColumn(table, colName) {
+    if (!table?.columns) return undefined;
+    let byName = columnIndex.get(table);
+    if (!byName) {
+        byName = new Map();
+        // First match wins, as with columns.find()
+        table.columns.forEach(c => { if (!byName.has(c.name)) byName.set(c.name, c); });
+        columnIndex.set(table, byName);
     }
+    return byName.get(colName);
 }
 
-function savePositions(positions) {
-    try {
-        localStorage.setItem(`schema-positions-${currentView}`, JSON.stringify(positions));
-    } catch (e) {
-        console.error('Failed to save positions:', e);
+// Saved positions are read from localStorage once per view and kept in memory;
+// writes are debounced so a burst of drags costs a single setItem per view
+const savedPositionsByView = {};
+const unsavedViews = new Set();
+let saveTimer = null;
+
+function loadSavedPositions(view = currentView) {
+    if (!(view in savedPositionsByView)) {
+        try {
+            const saved = localStorage.getItem(`schema-positions-${view}`);
+            savedPositionsByView[view] = saved ? JSON.parse(saved) : {};
+        } catch (e) {
+            console.error('Failed to load saved positions:', e);
+            savedPositionsByView[view] = {};
+        }
     }
+    return savedPositionsByView[view];
+}
+
+function savePositions(positions) {
+    savedPositionsByView[currentView] = positions;
+    unsavedViews.add(currentView);
+    clearTimeout(saveTimer);
+    saveTimer = setTimeout(flushSavedPositions, 300);
+}
+
+function flushSavedPositions() {
+    clearTimeout(saveTimer);
+    saveTimer = null;
+    unsavedViews.forEach(view => {
+        try {
+            localStorage.setItem(`schema-positions-${view}`, JSON.stringify(savedPositionsByView[view]));
+        } catch (e) {
+            console.error('Failed to save positions:', e);
+        }
+    });
+    unsavedViews.clear();
 }
 
+// Don't lose a pending write when the page goes away
+window.addEventListener('pagehide', flushSavedPositions);
+
 function resetPositions() {
     if (confirm('Reset all table positions to default layout?')) {
         localStorage.removeItem(`schema-positions-${currentView}`);
-        renderGraph();
+        savedPositionsByView[currentView] = {};
+        unsavedViews.delete(currentView);
+        delete layoutCache[currentView];
+        scheduleRender();
     }
 }
 
-function layoutTables(tables) {
-    const relations = fkRelations[currentView] || [];
+function layoutTables(tables, view = currentView) {
+    // Layout only depends on the view's tables and saved positions, so reuse
+    // the previous result; endDrag updates moved tables in place
+    const cached = layoutCache[view];
+    if (cached && cached.tables === tables) {
+        return cached.positions;
+    }
+    
+    const relations = fkRelations[view] || [];
     
     // Count connections per table
     const connectionCount = {};
     Object.keys(tables).forEach(t => connectionCount[t] = 0);
     relations.forEach(rel => {
-        connectionCount[rel.from_table] = (connectionCount[rel.from_table] || 0) + 1;
-        connectionCount[rel.to_table] = (connectionCount[rel.to_table] || 0) + 1;
+        // Only tables in this view matter; FKs may point outside it
+        if (rel.from_table in connectionCount) connectionCount[rel.from_table]++;
+        if (rel.to_table in connectionCount) connectionCount[rel.to_table]++;
     });
     
     // Separate tables into CONNECTED (has FK) and ISOLATED (no FK)
@@ -690,10 +964,12 @@ function layoutTables(tables) {
     });
     
     // Sort connected tables by connection count (most connected first for spiral)
-    connectedTables.sort((a, b) => (connectionCount[b] || 0) - (connectionCount[a] || 0));
+    connectedTables.sort((a, b) => connectionCount[b] - connectionCount[a]);
     
     const positions = {};
-    const getWidth = (name) => Math.max(95, Math.min(200, name.length * 7 + 20));
+    // Box width per table, computed once up front
+    const widths = {};
+    for (const name in tables) widths[name] = Math.max(95, Math.min(200, name.length * 7 + 20));
     
     // SPIRAL LAYOUT - ONLY for connected tables (those with FK relationships)
     const centerX = 800; // Center of canvas
@@ -701,23 +977,47 @@ function layoutTables(tables) {
     const boxHeight = 55; // Height including padding
     const minSpacing = 35; // Minimum space between boxes
     
+    // Spatial hash of placed boxes: each box is filed under every grid cell
+    // it covers, so an overlap check only visits nearby boxes
+    const cellSize = 120;
+    const grid = new Map();
+    const placeBox = (name, x, y, w) => {
+        const pos = { x, y, w };
+        positions[name] = pos;
+        for (let cx = Math.floor(x / cellSize); cx <= Math.floor((x + w) / cellSize); cx++) {
+            for (let cy = Math.floor(y / cellSize); cy <= Math.floor((y + boxHeight) / cellSize); cy++) {
+                const key = `${cx},${cy}`;
+                const cell = grid.get(key);
+                if (cell) cell.push(pos);
+                else grid.set(key, [pos]);
+            }
+        }
+    };
+    
     if (connectedTables.length > 0) {
         // Start with most connected table at center
         const firstTable = connectedTables[0];
-        const firstW = getWidth(firstTable);
-        positions[firstTable] = { x: centerX - firstW / 2, y: centerY, w: firstW };
+        const firstW = widths[firstTable];
+        placeBox(firstTable, centerX - firstW / 2, centerY, firstW);
     }
     
     // Helper function to check if a position overlaps with existing boxes
-    const checkOverlap = (x, y, w) => {
-        for (const [name, pos] of Object.entries(positions)) {
-            const dx = Math.abs((x + w/2) - (pos.x + pos.w/2));
-            const dy = Math.abs((y + boxHeight/2) - (pos.y + boxHeight/2));
-            const minDx = (w + pos.w)/2 + minSpacing;
-            const minDy = boxHeight + minSpacing;
-            
-            if (dx < minDx && dy < minDy) {
-                return true; // Overlap detected
+    // (only boxes in the cells covered by the candidate plus spacing can clash)
+    const checkOverlap = (x, y, w, spacing = minSpacing) => {
+        const minDy = boxHeight + spacing;
+        for (let cx = Math.floor((x - spacing) / cellSize); cx <= Math.floor((x + w + spacing) / cellSize); cx++) {
+            for (let cy = Math.floor((y - spacing) / cellSize); cy <= Math.floor((y + boxHeight + spacing) / cellSize); cy++) {
+                const cell = grid.get(`${cx},${cy}`);
+                if (!cell) continue;
+                for (const pos of cell) {
+                    const dx = Math.abs((x + w/2) - (pos.x + pos.w/2));
+                    const dy = Math.abs((y + boxHeight/2) - (pos.y + boxHeight/2));
+                    const minDx = (w + pos.w)/2 + spacing;
+                    
+                    if (dx < minDx && dy < minDy) {
+                        return true; // Overlap detected
+                    }
+                }
             }
         }
         return false;
@@ -732,7 +1032,7 @@ function layoutTables(tables) {
     // Place remaining CONNECTED tables in spiral
     for (let i = 1; i < connectedTables.length; i++) {
         const tableName = connectedTables[i];
-        const w = getWidth(tableName);
+        const w = widths[tableName];
         
         let placed = false;
         let attempts = 0;
@@ -744,7 +1044,7 @@ function layoutTables(tables) {
             const y = centerY + radius * Math.sin(angle);
             
             if (!checkOverlap(x, y, w)) {
-                positions[tableName] = { x, y, w };
+                placeBox(tableName, x, y, w);
                 placed = true;
             } else {
                 // Move to next position in spiral
@@ -759,7 +1059,7 @@ function layoutTables(tables) {
         if (!placed) {
             const x = centerX + radius * Math.cos(angle) - w / 2;
             const y = centerY + radius * Math.sin(angle);
-            positions[tableName] = { x, y, w };
+            placeBox(tableName, x, y, w);
         }
         
         // Continue spiral for next box
@@ -771,11 +1071,11 @@ function layoutTables(tables) {
     // Group by category and arrange in COMPACT columns on the RIGHT side
     if (isolatedTables.length > 0) {
         // Group isolated tables by category
-        const isolatedByCategory = {};
+        const isolatedByCategory = new Map();
         isolatedTables.forEach(name => {
             const cat = tables[name].category || 'core';
-            if (!isolatedByCategory[cat]) isolatedByCategory[cat] = [];
-            isolatedByCategory[cat].push(name);
+            if (!isolatedByCategory.has(cat)) isolatedByCategory.set(cat, []);
+            isolatedByCategory.get(cat).push(name);
         });
         
         // Arrange in COMPACT columns on RIGHT side (better use of horizontal space!)
@@ -790,13 +1090,12 @@ function layoutTables(tables) {
         let currentY = 100; // Start from top
         
         catOrder.forEach(cat => {
-            if (!isolatedByCategory[cat] || isolatedByCategory[cat].length === 0) return;
-            
-            const tablesInCat = isolatedByCategory[cat];
+            const tablesInCat = isolatedByCategory.get(cat);
+            if (!tablesInCat) return;
             
             // Place tables vertically in current column
             tablesInCat.forEach(name => {
-                const w = getWidth(name);
+                const w = widths[name];
                 
                 // Check if we need to start a new column (height exceeded)
                 if (currentY + boxHeight > maxColumnHeight) {
@@ -810,18 +1109,8 @@ function layoutTables(tables) {
                 let attempts = 0;
                 
                 while (attempts < 10) {
-                    let hasOverlap = false;
-                    for (const [existingName, existingPos] of Object.entries(positions)) {
-                        const dx = Math.abs((x + w/2) - (existingPos.x + existingPos.w/2));
-                        const dy = Math.abs((y + boxHeight/2) - (existingPos.y + boxHeight/2));
-                        if (dx < (w + existingPos.w)/2 + 10 && dy < boxHeight + 10) {
-                            hasOverlap = true;
-                            break;
-                        }
-                    }
-                    
-                    if (!hasOverlap) {
-                        positions[name] = { x, y, w };
+                    if (!checkOverlap(x, y, w, 10)) {
+                        placeBox(name, x, y, w);
                         break;
                     }
                     
@@ -832,7 +1121,7 @@ function layoutTables(tables) {
                 
                 // Force place if couldn't find spot
                 if (!positions[name]) {
-                    positions[name] = { x, y: currentY, w };
+                    placeBox(name, x, currentY, w);
                 }
                 
                 currentY += boxHeight + vGap;
@@ -844,13 +1133,14 @@ function layoutTables(tables) {
     }
     
     // Merge with saved positions (overrides default layout)
-    const savedPositions = loadSavedPositions();
+    const savedPositions = loadSavedPositions(view);
     Object.keys(savedPositions).forEach(name => {
         if (positions[name]) {
             positions[name] = { ...positions[name], ...savedPositions[name] };
         }
     });
     
+    layoutCache[view] = { tables, positions };
     return positions;
 }
 
@@ -866,6 +1156,203 @@ function renderLegend() {
     document.getElementById('stats').textContent = `${tableCount} tables • ${colCount} columns`;
 }
 
+// Migration coverage badge for an old-schema table node. Depends only on the
+// table's columns, so it is built once per table and reused by every render.
+const badgeCache = new WeakMap();
+function migrationBadgeFor(table) {
+    let badge = badgeCache.get(table);
+    if (badge !== undefined) return badge;
+    
+    let toTenantCount = 0, toCentralCount = 0;
+    
+    table.columns.forEach(col => {
+        if (!col.deprecated) {
+            if (col.targets && col.targets.length > 0) {
+                const hasTenant = col.targets.some(t => t.db === 'tenant' || !t.db || t.db === 'default');
+                const hasCentral = col.targets.some(t => t.db === 'central');
+                if (hasTenant) toTenantCount++;
+                if (hasCentral) toCentralCount++;
+            } else if (col.target) {
+                toTenantCount++;
+            }
+        }
+    });
+    
+    const total = table.columns.length;
+    const tenantPct = total > 0 ? Math.round((toTenantCount / total) * 100) : 0;
+    const centralPct = total > 0 ? Math.round((toCentralCount / total) * 100) : 0;
+    
+    // Build compact badge with both percentages
+    if (tenantPct > 0 || centralPct > 0) {
+        let badgeText = '';
+        if (tenantPct > 0) badgeText += `T:${tenantPct}%`;
+        if (centralPct > 0) {
+            if (badgeText) badgeText += ' ';
+            badgeText += `C:${centralPct}%`;
+        }
+        
+        // Color based on presence
+        let badgeColor;
+        if (tenantPct > 0 && centralPct > 0) {
+            badgeColor = '#a371f7'; // Purple - both
+        } else if (centralPct > 0) {
+            badgeColor = '#db6d28'; // Orange - central only
+        } else {
+            badgeColor = '#3fb950'; // Green - tenant only
+        }
+        
+        badge = `<text x="8" y="42" font-size="8" fill="${badgeColor}" font-weight="500">${badgeText}</text>`;
+    } else {
+        // Mostly deprecated
+        badge = `<text x="8" y="42" font-size="8" fill="#f85149" font-weight="500">deprecated</text>`;
+    }
+    
+    badgeCache.set(table, badge);
+    return badge;
+}
+
+// Edges and centre of a table node's 45px-high box
+function tableBox(p) {
+    return {
+        x1: p.x, y1: p.y, x2: p.x + p.w, y2: p.y + 45,
+        cx: p.x + p.w / 2, cy: p.y + 22.5 // Middle of 45px height
+    };
+}
+
+// Decide whether arrows between two boxes must route around, and where.
+// Every arrow of a table pair shares the same boxes, so this runs once per
+// pair. Returns the horizontal crossing line (clearY) or vertical one (clearX).
+function pairDetour(fromBox, toBox) {
+    const detour = { clearX: null, clearY: null };
+    
+    // ONLY route around if the two boxes themselves overlap in the crossing direction
+    // (This means one box is directly blocking the other)
+    const dx = toBox.cx - fromBox.cx;
+    const dy = toBox.cy - fromBox.cy;
+    const clearance = 40;
+    if (Math.abs(dx) > Math.abs(dy)) {
+        // Horizontal movement - check if boxes overlap vertically
+        const overlapVertically = !(fromBox.y2 < toBox.y1 || fromBox.y1 > toBox.y2);
+        if (overlapVertically) {
+            // Boxes are on same horizontal plane - route below or above
+            detour.clearY = dy > 0 || fromBox.y1 < toBox.y1
+                ? round1(Math.max(fromBox.y2, toBox.y2) + clearance)
+                : round1(Math.max(180, Math.min(fromBox.y1, toBox.y1) - clearance));
+        }
+    } else {
+        // Vertical movement - check if boxes overlap horizontally
+        const overlapHorizontally = !(fromBox.x2 < toBox.x1 || fromBox.x1 > toBox.x2);
+        if (overlapHorizontally) {
+            // Boxes are on same vertical plane - route to the right or left
+            detour.clearX = dx > 0 || fromBox.x1 < toBox.x1
+                ? round1(Math.max(fromBox.x2, toBox.x2) + clearance)
+                : round1(Math.max(30, Math.min(fromBox.x1, toBox.x1) - clearance));
+        }
+    }
+    return detour;
+}
+
+// Endpoints, path and label positions for one FK arrow between two boxes.
+// offset spreads arrows within a table pair, globalOffset across a table's
+// arrows; detour comes from pairDetour(). x1..y2 bound the path, for culling.
+function arrowGeometry(fromBox, toBox, offset, globalOffset, detour) {
+    // Calculate centers of both boxes
+    const fromCenterX = fromBox.cx;
+    const fromCenterY = fromBox.cy;
+    const toCenterX = toBox.cx;
+    const toCenterY = toBox.cy;
+    
+    // Determine best exit/entry points based on relative positions
+    let fromX, fromY, toX, toY;
+    const dx = toCenterX - fromCenterX;
+    const dy = toCenterY - fromCenterY;
+    
+    if (Math.abs(dx) > Math.abs(dy)) {
+        // Horizontal connection dominates
+        if (dx > 0) {
+            // From left to right: exit right side of from, enter left side of to
+            fromX = fromBox.x2;
+            fromY = fromCenterY + offset + globalOffset;
+            toX = toBox.x1;
+            toY = toCenterY + offset + globalOffset;
+        } else {
+            // From right to left: exit left side of from, enter right side of to
+            fromX = fromBox.x1;
+            fromY = fromCenterY + offset + globalOffset;
+            toX = toBox.x2;
+            toY = toCenterY + offset + globalOffset;
+        }
+    } else {
+        // Vertical connection dominates (most common)
+        if (dy > 0) {
+            // From top to bottom: exit bottom of from, enter top of to
+            fromX = fromCenterX + offset + globalOffset;
+            fromY = fromBox.y2;
+            toX = toCenterX + offset + globalOffset;
+            toY = toBox.y1;
+        } else {
+            // From bottom to top: exit top of from, enter bottom of to
+            fromX = fromCenterX + offset + globalOffset;
+            fromY = fromBox.y1;
+            toX = toCenterX + offset + globalOffset;
+            toY = toBox.y2;
+        }
+    }
+    fromX = round1(fromX); fromY = round1(fromY);
+    toX = round1(toX); toY = round1(toY);
+    
+    // SIMPLE PATH - default to straight L-shape, only route around if REALLY blocked
+    let path;
+    
+    // Default: Simple L-shape (exit → cross → enter)
+    if (Math.abs(dx) > Math.abs(dy)) {
+        // Primarily horizontal movement
+        path = `M${fromX},${fromY} L${fromX},${toY} L${toX},${toY}`;
+    } else {
+        // Primarily vertical movement  
+        path = `M${fromX},${fromY} L${fromX},${toY} L${toX},${toY}`;
+    }
+    
+    // Bounding box of the path, for culling; widened below if it routes around
+    let pathX1 = Math.min(fromX, toX), pathX2 = Math.max(fromX, toX);
+    let pathY1 = Math.min(fromY, toY), pathY2 = Math.max(fromY, toY);
+    
+    // Route around only if the boxes block each other (decided once per pair)
+    if (detour.clearY !== null) {
+        const clearY = detour.clearY;
+        path = `M${fromX},${fromY} L${fromX},${clearY} L${toX},${clearY} L${toX},${toY}`;
+        pathY1 = Math.min(pathY1, clearY);
+        pathY2 = Math.max(pathY2, clearY);
+    } else if (detour.clearX !== null) {
+        const clearX = detour.clearX;
+        path = `M${fromX},${fromY} L${clearX},${fromY} L${clearX},${toY} L${toX},${toY}`;
+        pathX1 = Math.min(pathX1, clearX);
+        pathX2 = Math.max(pathX2, clearX);
+    }
+    
+    // Add cardinality labels with better positioning based on arrow direction
+    let labelFromX, labelFromY, labelToX, labelToY;
+    
+    if (Math.abs(dx) > Math.abs(dy)) {
+        // Horizontal arrow - place labels to the side
+        labelFromX = fromX + (dx > 0 ? 8 : -15);
+        labelFromY = fromY - 5;
+        labelToX = toX + (dx > 0 ? -15 : 8);
+        labelToY = toY - 5;
+    } else {
+        // Vertical arrow - place labels offset horizontally
+        labelFromX = fromX + 8;
+        labelFromY = fromY + (dy > 0 ? 12 : -8);
+        labelToX = toX + 8;
+        labelToY = toY + (dy > 0 ? -8 : 12);
+    }
+    
+    return {
+        path, labelFromX, labelFromY, labelToX, labelToY,
+        x1: pathX1, y1: pathY1, x2: pathX2, y2: pathY2
+    };
+}
+
 function renderGraph() {
     const schema = getSchema();
     const positions = layoutTables(schema);
@@ -883,10 +1370,27 @@ function renderGraph() {
     const canvasHeight = Math.max(maxY, 1200); // Minimum height = 1200px (was 1000px)
     const canvasWidth = Math.max(maxX + 100, 2200); // Wider canvas for right-side tables
     
-    let svg = `<svg width="${canvasWidth}" height="${canvasHeight}" style="min-width:100%">`;
+    // Only emit what is on screen, plus one viewport of overdraw on each side so
+    // ordinary scrolling doesn't need a re-render (see onGraphScroll)
+    const graphPanel = document.getElementById('graphPanel');
+    const viewW = graphPanel.clientWidth, viewH = graphPanel.clientHeight;
+    const cull = viewW > 0 && viewH > 0; // not laid out yet -> draw everything
+    const area = {
+        x1: graphPanel.scrollLeft - viewW, y1: graphPanel.scrollTop - viewH,
+        x2: graphPanel.scrollLeft + 2 * viewW, y2: graphPanel.scrollTop + 2 * viewH
+    };
+    renderedArea = cull ? area : null;
+    const isVisible = (x1, y1, x2, y2) =>
+        !cull || !(x2 < area.x1 || x1 > area.x2 || y2 < area.y1 || y1 > area.y2);
+    // A pinned FK/PK highlight keeps its arrows and tables drawn wherever they are
+    const pinned = pinnedHighlight && pinnedHighlight.view === currentView ? pinnedHighlight : null;
+    const pinnedTables = new Set(pinned ? pinned.tables : []);
+    
+    // Collected in an array and joined once at the end
+    const svgParts = [`<svg width="${canvasWidth}" height="${canvasHeight}" style="min-width:100%">`];
     
     // Define markers for relationship cardinality
-    svg += `<defs>
+    svgParts.push(`<defs>
         <marker id="arrowhead" markerWidth="8" markerHeight="6" refX="7" refY="3" orient="auto">
             <polygon points="0 0, 8 3, 0 6" fill="#a371f7"/>
         </marker>
@@ -896,27 +1400,56 @@ function renderGraph() {
         <marker id="many-mark" markerWidth="10" markerHeight="10" refX="7" refY="5" orient="auto">
             <path d="M 0,2 L 7,5 L 0,8" fill="none" stroke="#a371f7" stroke-width="1.5"/>
         </marker>
-    </defs>`;
+    </defs>`);
+    
+    // Box edges and centres per table, computed once rather than per arrow end
+    const boxes = new Map();
+    for (const [name, p] of Object.entries(positions)) {
+        boxes.set(name, tableBox(p));
+    }
+    
+    // Only relations with both tables laid out get arrows; filter them once
+    const drawable = relations.filter(rel => boxes.has(rel.from_table) && boxes.has(rel.to_table));
     
-    // Group relationships by table pairs to detect overlaps
+    // Group relationships by table pairs to detect overlaps, remembering each
+    // relation's position within its pair. Also give each arrow an exit slot
+    // among all arrows leaving its table.
     const relationsByPair = {};
-    relations.forEach(rel => {
+    const routeByPair = {};
+    const indexInPair = new Array(drawable.length);
+    const exitSlot = new Array(drawable.length);
+    const exitCount = new Map();
+    drawable.forEach((rel, i) => {
         const key = `${rel.from_table}->${rel.to_table}`;
-        if (!relationsByPair[key]) relationsByPair[key] = [];
+        if (!relationsByPair[key]) {
+            relationsByPair[key] = [];
+            routeByPair[key] = pairDetour(boxes.get(rel.from_table), boxes.get(rel.to_table));
+        }
+        indexInPair[i] = relationsByPair[key].length;
         relationsByPair[key].push(rel);
+        
+        exitSlot[i] = exitCount.get(rel.from_table) || 0;
+        exitCount.set(rel.from_table, exitSlot[i] + 1);
     });
     
+    // Arrows drawn (or culled) this render, and per table the arrows touching it
+    const arrows = [];
+    const arrowsByTable = new Map();
+    const addArrow = (table, arrow) => {
+        if (!arrowsByTable.has(table)) arrowsByTable.set(table, []);
+        arrowsByTable.get(table).push(arrow);
+    };
+    
     // Draw FK arrows with orthogonal routing
-    relations.forEach((rel, idx) => {
-        const fromPos = positions[rel.from_table];
-        const toPos = positions[rel.to_table];
-        if (!fromPos || !toPos) return;
+    drawable.forEach((rel, i) => {
+        const fromBox = boxes.get(rel.from_table);
+        const toBox = boxes.get(rel.to_table);
         
         // Get column details for FK
         const fromTable = schema[rel.from_table];
         const toTable = schema[rel.to_table];
-        const fromCol = fromTable?.columns?.find(c => c.name === rel.from_col);
-        const toCol = toTable?.columns?.find(c => c.name === rel.to_col);
+        const fromCol = getColumn(fromTable, rel.from_col);
+        const toCol = getColumn(toTable, rel.to_col);
         
         const fromType = fromCol?.type || 'unknown';
         const toType = toCol?.type || 'unknown';
@@ -924,20 +1457,8 @@ function renderGraph() {
         
         // Determine offset based on relationships between same tables
         const pairKey = `${rel.from_table}->${rel.to_table}`;
-        const pairRels = relationsByPair[pairKey];
-        const relIndexInPair = pairRels.indexOf(rel);
-        const totalInPair = pairRels.length;
-        
-        // Calculate centers of both boxes
-        const fromCenterX = fromPos.x + fromPos.w / 2;
-        const fromCenterY = fromPos.y + 22.5; // Middle of 45px height
-        const toCenterX = toPos.x + toPos.w / 2;
-        const toCenterY = toPos.y + 22.5;
-        
-        // Determine best exit/entry points based on relative positions
-        let fromX, fromY, toX, toY;
-        const dx = toCenterX - fromCenterX;
-        const dy = toCenterY - fromCenterY;
+        const relIndexInPair = indexInPair[i];
+        const totalInPair = relationsByPair[pairKey].length;
         
         // Spread arrows to prevent label overlap - DOUBLED spacing as requested
         const arrowSpacing = 16; // 16px spacing between arrows (was 8px - DOUBLED!)
@@ -947,96 +1468,30 @@ function renderGraph() {
         }
         
         // Add global offset based on all arrows from this table (not just to same target)
-        // This prevents ALL arrows from exiting at exact center
+        // This prevents ALL arrows from exiting at exact center: the table's
+        // arrows are centred on its middle, 10px apart, squeezed to stay within ±30px
         const globalSpacing = 10; // 10px spacing (was 5px - DOUBLED!)
-        const globalOffset = (idx % 7 - 3) * globalSpacing; // Spread across 7 positions: -30, -20, -10, 0, 10, 20, 30
-        
-        if (Math.abs(dx) > Math.abs(dy)) {
-            // Horizontal connection dominates
-            if (dx > 0) {
-                // From left to right: exit right side of from, enter left side of to
-                fromX = fromPos.x + fromPos.w;
-                fromY = fromCenterY + offset + globalOffset;
-                toX = toPos.x;
-                toY = toCenterY + offset + globalOffset;
-            } else {
-                // From right to left: exit left side of from, enter right side of to
-                fromX = fromPos.x;
-                fromY = fromCenterY + offset + globalOffset;
-                toX = toPos.x + toPos.w;
-                toY = toCenterY + offset + globalOffset;
-            }
-        } else {
-            // Vertical connection dominates (most common)
-            if (dy > 0) {
-                // From top to bottom: exit bottom of from, enter top of to
-                fromX = fromCenterX + offset + globalOffset;
-                fromY = fromPos.y + 45;
-                toX = toCenterX + offset + globalOffset;
-                toY = toPos.y;
-            } else {
-                // From bottom to top: exit top of from, enter bottom of to
-                fromX = fromCenterX + offset + globalOffset;
-                fromY = fromPos.y;
-                toX = toCenterX + offset + globalOffset;
-                toY = toPos.y + 45;
-            }
-        }
-        
-        // SIMPLE PATH - default to straight L-shape, only route around if REALLY blocked
-        let path;
+        const exits = exitCount.get(rel.from_table);
+        const globalOffset = exits > 1
+            ? (exitSlot[i] - (exits - 1) / 2) * Math.min(globalSpacing, 60 / (exits - 1))
+            : 0;
         
-        // Default: Simple L-shape (exit → cross → enter)
-        if (Math.abs(dx) > Math.abs(dy)) {
-            // Primarily horizontal movement
-            path = `M${fromX},${fromY} L${fromX},${toY} L${toX},${toY}`;
-        } else {
-            // Primarily vertical movement  
-            path = `M${fromX},${fromY} L${fromX},${toY} L${toX},${toY}`;
-        }
+        // Remembered so endDrag can re-route this arrow without a full render
+        const arrow = { id: arrows.length, rel, offset, globalOffset };
+        arrows.push(arrow);
+        addArrow(rel.from_table, arrow);
+        if (rel.to_table !== rel.from_table) addArrow(rel.to_table, arrow);
         
-        // ONLY route around if the two boxes themselves overlap in the crossing direction
-        // (This means one box is directly blocking the other)
-        const fromBox = { x1: fromPos.x, y1: fromPos.y, x2: fromPos.x + fromPos.w, y2: fromPos.y + 45 };
-        const toBox = { x1: toPos.x, y1: toPos.y, x2: toPos.x + toPos.w, y2: toPos.y + 45 };
+        const geo = arrowGeometry(fromBox, toBox, offset, globalOffset, routeByPair[pairKey]);
         
-        if (Math.abs(dx) > Math.abs(dy)) {
-            // Horizontal movement - check if boxes overlap vertically
-            const overlapVertically = !(fromBox.y2 < toBox.y1 || fromBox.y1 > toBox.y2);
-            if (overlapVertically) {
-                // Boxes are on same horizontal plane - route around
-                const clearance = 40;
-                if (dy > 0 || fromBox.y1 < toBox.y1) {
-                    // Route below
-                    const clearY = Math.max(fromBox.y2, toBox.y2) + clearance;
-                    path = `M${fromX},${fromY} L${fromX},${clearY} L${toX},${clearY} L${toX},${toY}`;
-                } else {
-                    // Route above
-                    const clearY = Math.max(180, Math.min(fromBox.y1, toBox.y1) - clearance);
-                    path = `M${fromX},${fromY} L${fromX},${clearY} L${toX},${clearY} L${toX},${toY}`;
-                }
-            }
-        } else {
-            // Vertical movement - check if boxes overlap horizontally
-            const overlapHorizontally = !(fromBox.x2 < toBox.x1 || fromBox.x1 > toBox.x2);
-            if (overlapHorizontally) {
-                // Boxes are on same vertical plane - route around
-                const clearance = 40;
-                if (dx > 0 || fromBox.x1 < toBox.x1) {
-                    // Route to the right
-                    const clearX = Math.max(fromBox.x2, toBox.x2) + clearance;
-                    path = `M${fromX},${fromY} L${clearX},${fromY} L${clearX},${toY} L${toX},${toY}`;
-                } else {
-                    // Route to the left
-                    const clearX = Math.max(30, Math.min(fromBox.x1, toBox.x1) - clearance);
-                    path = `M${fromX},${fromY} L${clearX},${fromY} L${clearX},${toY} L${toX},${toY}`;
-                }
-            }
-        }
+        // Labels sit within 15px of the path ends
+        if (!(pinned && isPinnedRelation(pinned, rel)) &&
+            !isVisible(geo.x1 - 15, geo.y1 - 15, geo.x2 + 15, geo.y2 + 15)) return;
         
         // Add invisible wide stroke for easier hovering
-        svg += `<path d="${path}" fill="none" stroke="transparent" stroke-width="12" 
+        svgParts.push(`<path d="${geo.path}" fill="none" stroke="transparent" stroke-width="12" 
             style="cursor:help;"
+            data-arrow="${arrow.id}"
             data-from-table="${rel.from_table}" 
             data-from-col="${rel.from_col}" 
             data-from-type="${fromType}"
@@ -1045,113 +1500,158 @@ function renderGraph() {
             data-to-type="${toType}"
             data-relationship="${relationshipType}"
             onmousemove="showFKTooltip(event, this)"
-            onmouseleave="hideFKTooltip()"/>`;
+            onmouseleave="hideFKTooltip()"/>`);
         
         // Add visible relationship arrow on top
-        svg += `<path d="${path}" fill="none" stroke="#a371f7" stroke-width="1.5" 
+        svgParts.push(`<path d="${geo.path}" fill="none" stroke="#a371f7" stroke-width="1.5" 
             stroke-opacity="0.6" marker-end="url(#arrowhead)" class="fk-line"
-            style="pointer-events:none;"/>`;
-        
-        // Add cardinality labels with better positioning based on arrow direction
-        let labelFromX, labelFromY, labelToX, labelToY;
-        
-        if (Math.abs(dx) > Math.abs(dy)) {
-            // Horizontal arrow - place labels to the side
-            labelFromX = fromX + (dx > 0 ? 8 : -15);
-            labelFromY = fromY - 5;
-            labelToX = toX + (dx > 0 ? -15 : 8);
-            labelToY = toY - 5;
-        } else {
-            // Vertical arrow - place labels offset horizontally
-            labelFromX = fromX + 8;
-            labelFromY = fromY + (dy > 0 ? 12 : -8);
-            labelToX = toX + 8;
-            labelToY = toY + (dy > 0 ? -8 : 12);
-        }
+            style="pointer-events:none;"/>`);
         
-        svg += `<text x="${labelFromX}" y="${labelFromY}" font-size="9" fill="#a371f7" font-weight="500" font-family="monospace">N</text>`;
-        svg += `<text x="${labelToX}" y="${labelToY}" font-size="9" fill="#a371f7" font-weight="500" font-family="monospace">1</text>`;
+        svgParts.push(`<text x="${geo.labelFromX}" y="${geo.labelFromY}" font-size="9" fill="#a371f7" font-weight="500" font-family="monospace">N</text>`);
+        svgParts.push(`<text x="${geo.labelToX}" y="${geo.labelToY}" font-size="9" fill="#a371f7" font-weight="500" font-family="monospace">1</text>`);
     });
     
+    // Tables touched by any FK, for the "• FK" marker
+    const fkTables = new Set();
+    relations.forEach(r => { fkTables.add(r.from_table); fkTables.add(r.to_table); });
+    
     // Draw table nodes
     Object.entries(positions).forEach(([name, pos]) => {
         const table = schema[name];
         if (!table) return;
+        // The selected table is always drawn so navigateTo can scroll to it
+        if (name !== selectedTable && !pinnedTables.has(name) &&
+            !isVisible(pos.x, pos.y, pos.x + pos.w, pos.y + 45)) return;
         const cat = table.category || 'core';
         const isSelected = selectedTable === name;
         const colCount = table.columns?.length || 0;
-        const hasFk = relations.some(r => r.from_table === name || r.to_table === name);
+        const hasFk = fkTables.has(name);
         
-        // Calculate migration stats (only for old schema)
-        let migrationBadge = '';
-        if (currentView === 'old' && table.columns) {
-            let toTenantCount = 0, toCentralCount = 0;
-            
-            table.columns.forEach(col => {
-                if (!col.deprecated) {
-                    if (col.targets && col.targets.length > 0) {
-                        const hasTenant = col.targets.some(t => t.db === 'tenant' || !t.db || t.db === 'default');
-                        const hasCentral = col.targets.some(t => t.db === 'central');
-                        if (hasTenant) toTenantCount++;
-                        if (hasCentral) toCentralCount++;
-                    } else if (col.target) {
-                        toTenantCount++;
-                    }
-                }
-            });
-            
-            const total = table.columns.length;
-            const tenantPct = total > 0 ? Math.round((toTenantCount / total) * 100) : 0;
-            const centralPct = total > 0 ? Math.round((toCentralCount / total) * 100) : 0;
-            
-            // Build compact badge with both percentages
-            if (tenantPct > 0 || centralPct > 0) {
-                let badgeText = '';
-                if (tenantPct > 0) badgeText += `T:${tenantPct}%`;
-                if (centralPct > 0) {
-                    if (badgeText) badgeText += ' ';
-                    badgeText += `C:${centralPct}%`;
-                }
-                
-                // Color based on presence
-                let badgeColor;
-                if (tenantPct > 0 && centralPct > 0) {
-                    badgeColor = '#a371f7'; // Purple - both
-                } else if (centralPct > 0) {
-                    badgeColor = '#db6d28'; // Orange - central only
-                } else {
-                    badgeColor = '#3fb950'; // Green - tenant only
-                }
-                
-                migrationBadge = `<text x="8" y="42" font-size="8" fill="${badgeColor}" font-weight="500">${badgeText}</text>`;
-            } else {
-                // Mostly deprecated
-                migrationBadge = `<text x="8" y="42" font-size="8" fill="#f85149" font-weight="500">deprecated</text>`;
-            }
-        }
+        // Migration stats badge (only for old schema)
+        const migrationBadge = currentView === 'old' && table.columns ? migrationBadgeFor(table) : '';
         
-        svg += `<g class="node ${isSelected ? 'selected' : ''}" 
+        svgParts.push(`<g class="node ${isSelected ? 'selected' : ''}" 
             data-table="${name}" 
             onclick="selectTable('${name}')"
             onmousedown="startDrag(event, '${name}')"
             style="cursor: move;"
-            transform="translate(${pos.x},${pos.y})">
+            transform="translate(${round1(pos.x)},${round1(pos.y)})">
             <rect class="node-bg stroke-${cat}" width="${pos.w}" height="45"/>
             <rect class="node-stripe c-${cat}" x="0" y="0" width="3" height="45"/>
             <text class="node-text" x="8" y="16">${name.length > pos.w/6.5 ? name.slice(0,Math.floor(pos.w/6.5)-1)+'…' : name}</text>
             <text class="node-count" x="8" y="32">${colCount} cols${hasFk ? ' • FK' : ''}</text>
             ${migrationBadge}
-        </g>`;
+        </g>`);
     });
     
-    svg += '</svg>';
-    const graphPanel = document.getElementById('graphPanel');
-    graphPanel.innerHTML = svg;
+    svgParts.push('</svg>');
+    graphPanel.innerHTML = svgParts.join('');
+    renderedArrows = { view: currentView, arrowsByTable, canvasWidth, canvasHeight };
+    nodeIndex = null;
+    fkLineIndex = null;
+    // The old elements are gone; mark the new ones
+    applyPinnedHighlight();
+}
+
+// Table name -> rendered node <g>, built on the first lookup after a render
+// so finding a node doesn't scan the whole SVG with a selector each time
+let nodeIndex = null;
+
+function getNode(tableName) {
+    if (!nodeIndex) {
+        nodeIndex = new Map();
+        document.getElementById('graphPanel').querySelectorAll('.node[data-table]').forEach(node => {
+            nodeIndex.set(node.dataset.table, node);
+        });
+    }
+    return nodeIndex.get(tableName) || null;
+}
+
+// Visible FK lines by the column they leave ('from') or point at ('to'),
+// keyed "table.col"; built on first use after a render like nodeIndex
+let fkLineIndex = null;
+
+function getFkLines(end, tableName, columnName) {
+    if (!fkLineIndex) {
+        fkLineIndex = { from: new Map(), to: new Map() };
+        const add = (index, key, line) => {
+            const lines = index.get(key);
+            if (lines) lines.push(line);
+            else index.set(key, [line]);
+        };
+        document.getElementById('graphPanel').querySelectorAll('path[data-arrow]').forEach(hoverPath => {
+            // The visible line is drawn right after its invisible hover path
+            const line = hoverPath.nextElementSibling;
+            if (!line || !line.classList.contains('fk-line')) return;
+            const { fromTable, fromCol, toTable, toCol } = hoverPath.dataset;
+            add(fkLineIndex.from, `${fromTable}.${fromCol}`, line);
+            add(fkLineIndex.to, `${toTable}.${toCol}`, line);
+        });
+    }
+    return fkLineIndex[end].get(`${tableName}.${columnName}`) || [];
+}
+
+// Arrows of the last render, so a drag can re-route just the moved table's
+// arrows in place instead of rebuilding the whole SVG
+let renderedArrows = null;
+
+// Re-route the arrows touching a moved table by patching their existing
+// elements. Returns false if that isn't possible (culled arrows, or the
+// table moved past the canvas edge) and a full render is needed instead.
+function patchArrows(tableName) {
+    if (!renderedArrows || renderedArrows.view !== currentView) return false;
+    const positions = layoutCache[currentView].positions;
+    const pos = positions[tableName];
+    if (pos.x + pos.w + 200 > renderedArrows.canvasWidth || pos.y + 350 > renderedArrows.canvasHeight) return false;
     
-    // Add global drag event listeners
-    graphPanel.addEventListener('mousemove', drag);
-    graphPanel.addEventListener('mouseup', endDrag);
-    graphPanel.addEventListener('mouseleave', endDrag);
+    const svg = document.getElementById('graphPanel').querySelector('svg');
+    const tableArrows = renderedArrows.arrowsByTable.get(tableName) || [];
+    const updates = [];
+    for (const arrow of tableArrows) {
+        const hoverPath = svg.querySelector(`path[data-arrow="${arrow.id}"]`);
+        if (!hoverPath) return false; // culled last render
+        updates.push([arrow, hoverPath]);
+    }
+    
+    for (const [arrow, hoverPath] of updates) {
+        const fromBox = tableBox(positions[arrow.rel.from_table]);
+        const toBox = tableBox(positions[arrow.rel.to_table]);
+        const geo = arrowGeometry(fromBox, toBox, arrow.offset, arrow.globalOffset, pairDetour(fromBox, toBox));
+        // Visible line and N / 1 labels follow the hover path
+        const line = hoverPath.nextElementSibling;
+        const fromLabel = line.nextElementSibling;
+        const toLabel = fromLabel.nextElementSibling;
+        hoverPath.setAttribute('d', geo.path);
+        line.setAttribute('d', geo.path);
+        fromLabel.setAttribute('x', geo.labelFromX);
+        fromLabel.setAttribute('y', geo.labelFromY);
+        toLabel.setAttribute('x', geo.labelToX);
+        toLabel.setAttribute('y', geo.labelToY);
+    }
+    return true;
+}
+
+// Coalesce re-render requests so several in one tick (e.g. endDrag followed
+// by selectTable) only rebuild the SVG once, on the next frame
+let renderQueued = false;
+function scheduleRender() {
+    if (renderQueued) return;
+    renderQueued = true;
+    requestAnimationFrame(() => {
+        renderQueued = false;
+        renderGraph();
+    });
+}
+
+// Re-render once scrolling brings the un-rendered area into view
+let renderedArea = null;
+function onGraphScroll() {
+    if (renderQueued || draggedTable || !renderedArea) return;
+    const panel = document.getElementById('graphPanel');
+    const left = panel.scrollLeft, top = panel.scrollTop;
+    if (left >= renderedArea.x1 && left + panel.clientWidth <= renderedArea.x2 &&
+        top >= renderedArea.y1 && top + panel.clientHeight <= renderedArea.y2) return;
+    scheduleRender();
 }
 
 function startDrag(event, tableName) {
@@ -1163,22 +1663,32 @@ function startDrag(event, tableName) {
     hasMoved = false;
     draggedTable = tableName;
     
+    // Do all DOM reads here so drag() only has to write
     const svg = document.getElementById('graphPanel').querySelector('svg');
-    const node = svg.querySelector(`[data-table="${tableName}"]`);
+    const node = getNode(tableName);
+    draggedNode = node;
+    draggedSvgRect = svg.getBoundingClientRect();
     const transform = node.getAttribute('transform');
     const match = transform.match(/translate\\(([-\\d.]+),([-\\d.]+)\\)/);
     
     if (match) {
         const nodeX = parseFloat(match[1]);
         const nodeY = parseFloat(match[2]);
-        const svgRect = svg.getBoundingClientRect();
         dragOffset = {
-            x: event.clientX - svgRect.left - nodeX,
-            y: event.clientY - svgRect.top - nodeY
+            x: event.clientX - draggedSvgRect.left - nodeX,
+            y: event.clientY - draggedSvgRect.top - nodeY
         };
     }
 }
 
+function flushDrag() {
+    dragFrame = null;
+    if (draggedNode && pendingDragPos) {
+        draggedNode.setAttribute('transform', `translate(${pendingDragPos.x},${pendingDragPos.y})`);
+    }
+    pendingDragPos = null;
+}
+
 function drag(event) {
     if (!draggedTable || !mouseDownPos) return;
     
@@ -1187,28 +1697,35 @@ function drag(event) {
     const dy = Math.abs(event.clientY - mouseDownPos.y);
     
     if (dx > 5 || dy > 5) {
+        if (!isDragging) {
+            draggedNode.style.opacity = '0.7';
+            draggedNode.style.cursor = 'grabbing';
+        }
         hasMoved = true;
         isDragging = true;
         
-        const svg = document.getElementById('graphPanel').querySelector('svg');
-        const svgRect = svg.getBoundingClientRect();
-        const node = svg.querySelector(`[data-table="${draggedTable}"]`);
-        
-        const newX = Math.max(0, event.clientX - svgRect.left - dragOffset.x);
-        const newY = Math.max(0, event.clientY - svgRect.top - dragOffset.y);
+        // Rect is dropped on scroll/resize; re-read it only then
+        if (!draggedSvgRect) draggedSvgRect = draggedNode.ownerSVGElement.getBoundingClientRect();
         
-        node.setAttribute('transform', `translate(${newX},${newY})`);
-        node.style.opacity = '0.7';
-        node.style.cursor = 'grabbing';
+        pendingDragPos = {
+            x: round1(Math.max(0, event.clientX - draggedSvgRect.left - dragOffset.x)),
+            y: round1(Math.max(0, event.clientY - draggedSvgRect.top - dragOffset.y))
+        };
+        if (!dragFrame) dragFrame = requestAnimationFrame(flushDrag);
     }
 }
 
 function endDrag(event) {
     if (!draggedTable) return;
     
+    // Apply any position still waiting for a frame
+    if (dragFrame) {
+        cancelAnimationFrame(dragFrame);
+        flushDrag();
+    }
+    
     const tableName = draggedTable;
-    const svg = document.getElementById('graphPanel').querySelector('svg');
-    const node = svg.querySelector(`[data-table="${tableName}"]`);
+    const node = draggedNode;
     
     if (hasMoved && isDragging) {
         // It was a DRAG - save the new position
@@ -1219,9 +1736,9 @@ function endDrag(event) {
             const newX = parseFloat(match[1]);
             const newY = parseFloat(match[2]);
             
-            // Save the new position
-            const schema = getSchema();
-            const positions = layoutTables(schema);
+            // Save the new position into the layout the last render drew from,
+            // so the re-render below reuses it instead of laying out again
+            const positions = layoutCache[currentView].positions;
             positions[tableName] = { ...positions[tableName], x: newX, y: newY };
             
             // Update localStorage
@@ -1229,8 +1746,8 @@ function endDrag(event) {
             savedPositions[tableName] = { x: newX, y: newY };
             savePositions(savedPositions);
             
-            // Re-render to update arrows
-            renderGraph();
+            // Update the arrows in place; fall back to a full re-render
+            if (!patchArrows(tableName)) scheduleRender();
         }
     } else {
         // It was a CLICK - select the table to view columns
@@ -1241,13 +1758,27 @@ function endDrag(event) {
     node.style.cursor = 'move';
     isDragging = false;
     draggedTable = null;
+    draggedNode = null;
+    draggedSvgRect = null;
     mouseDownPos = null;
     hasMoved = false;
 }
 
+// Scrolling or resizing moves the SVG, so the cached rect goes stale
+window.addEventListener('resize', () => { draggedSvgRect = null; });
+document.addEventListener('scroll', () => { draggedSvgRect = null; }, true);
+
+// Global drag listeners go on the panel itself, which outlives every re-render
+const graphPanelEl = document.getElementById('graphPanel');
+graphPanelEl.addEventListener('mousemove', drag);
+graphPanelEl.addEventListener('mouseup', endDrag);
+graphPanelEl.addEventListener('mouseleave', endDrag);
+graphPanelEl.addEventListener('scroll', onGraphScroll);
+window.addEventListener('resize', onGraphScroll);
+
 function selectTable(name) {
     selectedTable = name;
-    renderGraph();
+    scheduleRender();
     showPanel(name);
 }
 
@@ -1261,24 +1792,26 @@ function showPanel(name) {
         document.getElementById('detailBadge').textContent = categories[currentTable.category]?.name || currentTable.category;
     }
     
+    // Panel markup is collected in an array and joined once at the end
+    const parts = [];
+    
     // Show source tables section for new/central views
-    let sourceHtml = '';
     if (currentView !== 'old' && reverseMappings) {
         const schemaType = currentView === 'new' ? 'tenant' : 'central';
         const tableReverse = reverseMappings[schemaType]?.[name];
         
         if (tableReverse && tableReverse.sources && tableReverse.sources.length > 0) {
-            sourceHtml = '<div style="margin-bottom:12px;padding:10px;background:var(--card);border:1px solid var(--border);border-radius:6px;">';
-            sourceHtml += '<div style="font-size:11px;font-weight:600;color:var(--blue);margin-bottom:6px;">📋 Source Tables (Old Schema)</div>';
-            sourceHtml += '<div style="display:flex;flex-wrap:wrap;gap:6px;">';
+            parts.push('<div style="margin-bottom:12px;padding:10px;background:var(--card);border:1px solid var(--border);border-radius:6px;">');
+            parts.push('<div style="font-size:11px;font-weight:600;color:var(--blue);margin-bottom:6px;">📋 Source Tables (Old Schema)</div>');
+            parts.push('<div style="display:flex;flex-wrap:wrap;gap:6px;">');
             
             tableReverse.sources.forEach(srcTable => {
-                sourceHtml += `<span style="padding:4px 10px;background:var(--bg);border:1px solid var(--blue);border-radius:4px;font-size:10px;color:var(--blue);cursor:pointer;" onclick="navigateTo('old','${srcTable}',null)" title="Click to view ${srcTable} in old schema">`;
-                sourceHtml += `${srcTable}`;
-                sourceHtml += '</span>';
+                parts.push(`<span style="padding:4px 10px;background:var(--bg);border:1px solid var(--blue);border-radius:4px;font-size:10px;color:var(--blue);cursor:pointer;" onclick="navigateTo('old','${srcTable}',null)" title="Click to view ${srcTable} in old schema">`);
+                parts.push(srcTable);
+                parts.push('</span>');
             });
             
-            sourceHtml += '</div></div>';
+            parts.push('</div></div>');
         }
     }
     
@@ -1290,47 +1823,47 @@ function showPanel(name) {
     };
     const labels = schemaLabels[currentView] || schemaLabels['old'];
     
-    let html = sourceHtml + '<div style="margin-bottom:10px;font-size:11px;color:var(--dim)">Click any column for detailed migration info. <span class="hide-on-small">Showing migration relationships. <strong style="color:var(--purple)">💡 Tip:</strong> Click PK/FK badges to highlight arrows!</span></div>';
-    html += `<table class="comparison-table ${labels.showCol3 ? '' : 'two-column'}"><thead><tr>`;
-    html += `<th class="schema-col old-schema">${labels.col1}</th>`;
-    html += `<th class="schema-col new-schema">${labels.col2}</th>`;
+    parts.push('<div style="margin-bottom:10px;font-size:11px;color:var(--dim)">Click any column for detailed migration info. <span class="hide-on-small">Showing migration relationships. <strong style="color:var(--purple)">💡 Tip:</strong> Click PK/FK badges to highlight arrows!</span></div>');
+    parts.push(`<table class="comparison-table ${labels.showCol3 ? '' : 'two-column'}"><thead><tr>`);
+    parts.push(`<th class="schema-col old-schema">${labels.col1}</th>`);
+    parts.push(`<th class="schema-col new-schema">${labels.col2}</th>`);
     if (labels.showCol3) {
-        html += `<th class="schema-col central-schema">${labels.col3}</th>`;
+        parts.push(`<th class="schema-col central-schema">${labels.col3}</th>`);
     }
-    html += '</tr></thead><tbody>';
+    parts.push('</tr></thead><tbody>');
     
     // Check if table has columns
     if (!currentTable || !currentTable.columns) {
         const colspan = labels.showCol3 ? 3 : 2;
-        html += `<tr><td colspan="${colspan}" class="missing">No columns found</td></tr>`;
+        parts.push(`<tr><td colspan="${colspan}" class="missing">No columns found</td></tr>`);
     } else {
         // For each column in the current table
         currentTable.columns.forEach(col => {
-            html += '<tr>';
+            parts.push(`<tr data-col-name="${col.name}">`);
             
             // Column 1: Always show current column (clickable for details)
-            html += '<td class="schema-col old-schema">';
+            parts.push('<td class="schema-col old-schema">');
             const isDeprecated = col.deprecated;
             const hasMigration = col.target || (col.targets && col.targets.length > 0);
             
-            html += `<div class="${isDeprecated ? 'deprecated' : ''}" style="cursor:pointer" onclick="selectColumn('${name}','${col.name}')">`;
-            html += `<span class="col-name">${col.name}</span>`;
-            html += `<span class="col-type">${col.type}</span>`;
-            html += '<div class="col-badges">';
-            if (col.pk) html += `<span class="badge pk" onclick="event.stopPropagation(); highlightPKRelations('${name}','${col.name}')" title="Click to highlight FK arrows referencing this">PK</span>`;
-            if (col.fk) html += `<span class="badge fk" onclick="event.stopPropagation(); highlightFKRelation('${name}','${col.name}')" title="Click to highlight FK arrow">FK</span>`;
-            if (col.uk) html += '<span class="badge uk">UK</span>';
+            parts.push(`<div class="${isDeprecated ? 'deprecated' : ''}" style="cursor:pointer" onclick="selectColumn('${name}','${col.name}')">`);
+            parts.push(`<span class="col-name">${col.name}</span>`);
+            parts.push(`<span class="col-type">${col.type}</span>`);
+            parts.push('<div class="col-badges">');
+            if (col.pk) parts.push(`<span class="badge pk" onclick="event.stopPropagation(); highlightPKRelations('${name}','${col.name}')" title="Click to highlight FK arrows referencing this">PK</span>`);
+            if (col.fk) parts.push(`<span class="badge fk" onclick="event.stopPropagation(); highlightFKRelation('${name}','${col.name}')" title="Click to highlight FK arrow">FK</span>`);
+            if (col.uk) parts.push('<span class="badge uk">UK</span>');
             if (currentView === 'old') {
-                if (isDeprecated) html += '<span style="color:var(--red);margin-left:5px">❌</span>';
-                else if (hasMigration) html += '<span style="color:var(--green);margin-left:5px">→</span>';
+                if (isDeprecated) parts.push('<span style="color:var(--red);margin-left:5px">❌</span>');
+                else if (hasMigration) parts.push('<span style="color:var(--green);margin-left:5px">→</span>');
             } else if (col.source) {
-                html += '<span style="color:var(--blue);margin-left:5px">←</span>';
+                parts.push('<span style="color:var(--blue);margin-left:5px">←</span>');
             }
-            html += '</div></div>';
-            html += '</td>';
+            parts.push('</div></div>');
+            parts.push('</td>');
             
             // Column 2: Context-dependent
-            html += '<td class="schema-col new-schema">';
+            parts.push('<td class="schema-col new-schema">');
             if (currentView === 'old') {
                 // OLD SCHEMA VIEW: Show tenant migration targets
                 let tenantTargets = [];
@@ -1342,17 +1875,17 @@ function showPanel(name) {
                 }
                 
                 if (tenantTargets.length > 0) {
-                    html += '<div style="display:flex;flex-direction:column;gap:3px;">';
+                    parts.push('<div style="display:flex;flex-direction:column;gap:3px;">');
                     tenantTargets.forEach(target => {
-                        html += `<div style="cursor:pointer;padding:2px 6px;background:var(--bg);border-left:2px solid var(--green);border-radius:3px;word-wrap:break-word;overflow-wrap:break-word;" onclick="navigateTo('new','${target.table}','${target.column}')">`;
-                        html += `<span class="col-name" style="word-break:break-word;">${target.table}.${target.column}</span>`;
-                        html += '</div>';
+                        parts.push(`<div style="cursor:pointer;padding:2px 6px;background:var(--bg);border-left:2px solid var(--green);border-radius:3px;word-wrap:break-word;overflow-wrap:break-word;" onclick="navigateTo('new','${target.table}','${target.column}')">`);
+                        parts.push(`<span class="col-name" style="word-break:break-word;">${target.table}.${target.column}</span>`);
+                        parts.push('</div>');
                     });
-                    html += '</div>';
+                    parts.push('</div>');
                 } else if (isDeprecated) {
-                    html += '<span style="color:var(--red);font-size:9px;">Not migrated</span>';
+                    parts.push('<span style="color:var(--red);font-size:9px;">Not migrated</span>');
                 } else {
-                    html += '<span class="missing">—</span>';
+                    parts.push('<span class="missing">—</span>');
                 }
             } else {
                 // NEW/CENTRAL VIEW: Show source from old schema (clickable!)
@@ -1361,20 +1894,20 @@ function showPanel(name) {
                 const fieldSources = reverseMappings?.[schemaType]?.[name]?.fields?.[col.name];
                 
                 if (fieldSources && fieldSources.length > 0) {
-                    html += '<div style="display:flex;flex-direction:column;gap:3px;">';
+                    parts.push('<div style="display:flex;flex-direction:column;gap:3px;">');
                     fieldSources.forEach(src => {
                         const srcTable = src.old_table;
                         const srcCol = src.old_field;
                         const hasTransform = src.sql && src.sql.trim() !== '';
                         
-                        html += `<div style="cursor:pointer;padding:2px 6px;background:var(--bg);border-left:2px solid var(--blue);border-radius:3px;word-wrap:break-word;overflow-wrap:break-word;" onclick="navigateTo('old','${srcTable}','${srcCol}')" title="${hasTransform ? 'Transformed: ' + (src.sql || '') : 'Direct mapping'}">`;
-                        html += `<span class="col-name" style="word-break:break-word;">${srcTable}.${srcCol}</span>`;
+                        parts.push(`<div style="cursor:pointer;padding:2px 6px;background:var(--bg);border-left:2px solid var(--blue);border-radius:3px;word-wrap:break-word;overflow-wrap:break-word;" onclick="navigateTo('old','${srcTable}','${srcCol}')" title="${hasTransform ? 'Transformed: ' + (src.sql || '') : 'Direct mapping'}">`);
+                        parts.push(`<span class="col-name" style="word-break:break-word;">${srcTable}.${srcCol}</span>`);
                         if (hasTransform) {
-                            html += '<span style="color:var(--yellow);margin-left:4px;font-size:9px;" title="Field transformation applied">⚙️</span>';
+                            parts.push('<span style="color:var(--yellow);margin-left:4px;font-size:9px;" title="Field transformation applied">⚙️</span>');
                         }
-                        html += '</div>';
+                        parts.push('</div>');
                     });
-                    html += '</div>';
+                    parts.push('</div>');
                 } else if (col.source) {
                     // Fallback to old source property if reverse mapping not found
                     let srcTable, srcCol;
@@ -1394,18 +1927,18 @@ function showPanel(name) {
                         srcCol = src;
                     }
                     
-                    html += `<div style="cursor:pointer;padding:2px 6px;background:var(--bg);border-left:2px solid var(--blue);border-radius:3px;word-wrap:break-word;overflow-wrap:break-word;" onclick="navigateTo('old','${srcTable}','${srcCol}')">`;
-                    html += `<span class="col-name" style="word-break:break-word;">${srcTable}.${srcCol}</span>`;
-                    html += '</div>';
+                    parts.push(`<div style="cursor:pointer;padding:2px 6px;background:var(--bg);border-left:2px solid var(--blue);border-radius:3px;word-wrap:break-word;overflow-wrap:break-word;" onclick="navigateTo('old','${srcTable}','${srcCol}')">`);
+                    parts.push(`<span class="col-name" style="word-break:break-word;">${srcTable}.${srcCol}</span>`);
+                    parts.push('</div>');
                 } else {
-                    html += '<span class="missing">—</span>';
+                    parts.push('<span class="missing">—</span>');
                 }
             }
-            html += '</td>';
+            parts.push('</td>');
             
             // Column 3: Only show for old schema view
             if (labels.showCol3) {
-                html += '<td class="schema-col central-schema">';
+                parts.push('<td class="schema-col central-schema">');
                 if (currentView === 'old') {
                     // OLD SCHEMA VIEW: Show central migration targets
                     let centralTargets = [];
@@ -1414,62 +1947,66 @@ function showPanel(name) {
                     }
                     
                     if (centralTargets.length > 0) {
-                        html += '<div style="display:flex;flex-direction:column;gap:3px;">';
+                        parts.push('<div style="display:flex;flex-direction:column;gap:3px;">');
                         centralTargets.forEach(target => {
-                            html += `<div style="cursor:pointer;padding:2px 6px;background:var(--bg);border-left:2px solid var(--orange);border-radius:3px;word-wrap:break-word;overflow-wrap:break-word;" onclick="navigateTo('central','${target.table}','${target.column}')">`;
-                            html += `<span class="col-name" style="word-break:break-word;">${target.table}.${target.column}</span>`;
-                            html += '</div>';
+                            parts.push(`<div style="cursor:pointer;padding:2px 6px;background:var(--bg);border-left:2px solid var(--orange);border-radius:3px;word-wrap:break-word;overflow-wrap:break-word;" onclick="navigateTo('central','${target.table}','${target.column}')">`);
+                            parts.push(`<span class="col-name" style="word-break:break-word;">${target.table}.${target.column}</span>`);
+                            parts.push('</div>');
                         });
-                        html += '</div>';
+                        parts.push('</div>');
                     } else {
-                        html += '<span class="missing">—</span>';
+                        parts.push('<span class="missing">—</span>');
                     }
                 }
-                html += '</td>';
+                parts.push('</td>');
             }
             
-            html += '</tr>';
+            parts.push('</tr>');
         });
     }
     
-    html += '</tbody></table>';
-    document.getElementById('colsList').innerHTML = html;
+    parts.push('</tbody></table>');
+    document.getElementById('colsList').innerHTML = parts.join('');
     document.getElementById('migrationPanel').innerHTML = '<div class="empty-state"><h4>Select a column</h4><p>Click any column above for migration details</p></div>';
 }
 
+let selectedColEl = null; // Highlighted row in the column comparison table
+
+// View, label and colour of a migration target's database
+const TARGET_DB_META = {
+    central: { schema: 'central', label: 'Central DB', color: 'var(--orange)' },
+    tenant: { schema: 'new', label: 'Tenant DB', color: 'var(--green)' }
+};
+
 function selectColumn(tableName, colName) {
-    // Find and highlight the column item
-    document.querySelectorAll('.col-item').forEach(el => el.classList.remove('selected'));
-    const colItems = document.querySelectorAll('.col-item');
-    colItems.forEach(item => {
-        if (item.querySelector('.col-name')?.textContent === colName) {
-            item.classList.add('selected');
-        }
-    });
+    // Move the highlight from the previous row to this column's row
+    if (selectedColEl) selectedColEl.classList.remove('selected');
+    selectedColEl = document.getElementById('colsList').querySelector(`tr[data-col-name="${CSS.escape(colName)}"]`);
+    if (selectedColEl) selectedColEl.classList.add('selected');
     
     const table = getSchema()[tableName];
     if (!table) return;
-    const col = table.columns.find(c => c.name === colName);
+    const col = getColumn(table, colName);
     if (!col) return;
     
-    let html = '<div class="migration-title">Column Details</div>';
+    const htmlParts = ['<div class="migration-title">Column Details</div>'];
     
     // Current column info
     const schemaLabel = currentView === 'old' ? 'Old Schema' : (currentView === 'central' ? 'Central DB' : 'Tenant DB');
-    html += `<div class="lineage-box" style="border-left-color:var(--blue)">
+    htmlParts.push(`<div class="lineage-box" style="border-left-color:var(--blue)">
         <div class="lineage-label">Current: ${schemaLabel}</div>
         <div class="lineage-value">${tableName}.${colName}</div>
         <div style="font-size:9px;color:var(--dim);margin-top:3px">${col.type}${col.pk ? ' • PRIMARY KEY' : ''}${col.fk ? ' • FOREIGN KEY' : ''}${col.uk ? ' • UNIQUE' : ''}</div>
-    </div>`;
+    </div>`);
     
     // Show FK reference (for any schema)
     if (col.fk && col.fk_ref) {
         const [refTable, refCol] = col.fk_ref;
-        html += '<div class="lineage-arrow" style="color:var(--purple)">⤵ FK references</div>';
-        html += `<div class="lineage-box clickable" style="border-left-color:var(--purple)" onclick="navigateTo('${currentView}','${refTable}','${refCol}')">
+        htmlParts.push('<div class="lineage-arrow" style="color:var(--purple)">⤵ FK references</div>');
+        htmlParts.push(`<div class="lineage-box clickable" style="border-left-color:var(--purple)" onclick="navigateTo('${currentView}','${refTable}','${refCol}')">
             <div class="lineage-label">References <span style="font-size:8px;color:var(--blue)">→ click to view</span></div>
             <div class="lineage-value">${refTable}.${refCol}</div>
-        </div>`;
+        </div>`);
     }
     
     // Migration details based on current view
@@ -1478,46 +2015,44 @@ function selectColumn(tableName, colName) {
         if ((col.target || (col.targets && col.targets.length > 0)) && !col.deprecated) {
             // Handle multi-target format
             if (col.targets && col.targets.length > 0) {
-                html += '<div class="lineage-arrow" style="color:var(--green)">↓ migrates to</div>';
+                htmlParts.push('<div class="lineage-arrow" style="color:var(--green)">↓ migrates to</div>');
                 
-                col.targets.forEach((target, idx) => {
+                for (let idx = 0; idx < col.targets.length; idx++) {
+                    const target = col.targets[idx];
                     const targetTable = target.table || '';
                     const targetCol = target.column || '';
-                    const targetDb = target.db || 'tenant';
-                    const targetSchema = targetDb === 'central' ? 'central' : 'new';
-                    const targetLabel = targetDb === 'central' ? 'Central DB' : 'Tenant DB';
-                    const targetColor = targetDb === 'central' ? 'var(--orange)' : 'var(--green)';
+                    const meta = TARGET_DB_META[target.db === 'central' ? 'central' : 'tenant'];
                     
-                    html += `<div class="lineage-box target clickable" style="border-left-color:${targetColor}" onclick="navigateTo('${targetSchema}','${targetTable}','${targetCol}')">
-                        <div class="lineage-label">${idx + 1}. Target (${targetLabel}) <span style="font-size:8px;color:var(--blue)">→ click to view</span></div>
+                    htmlParts.push(`<div class="lineage-box target clickable" style="border-left-color:${meta.color}" onclick="navigateTo('${meta.schema}','${targetTable}','${targetCol}')">
+                        <div class="lineage-label">${idx + 1}. Target (${meta.label}) <span style="font-size:8px;color:var(--blue)">→ click to view</span></div>
                         <div class="lineage-value">${targetTable}.${targetCol}</div>
-                    </div>`;
+                    </div>`);
                     
                     if (target.sql) {
-                        html += `<div class="sql-label">Migration SQL #${idx + 1}</div>
-                            <div class="sql-box">${target.sql}</div>`;
+                        htmlParts.push(`<div class="sql-label">Migration SQL #${idx + 1}</div>
+                            <div class="sql-box">${target.sql}</div>`);
                     }
-                });
+                }
             } else {
                 // Handle old single-target format (backward compatible)
                 const [targetTable, targetCol] = col.target.includes('.') ? col.target.split('.') : [col.target, null];
-                html += '<div class="lineage-arrow" style="color:var(--green)">↓ migrates to</div>';
-                html += `<div class="lineage-box target clickable" onclick="navigateTo('new','${targetTable}','${targetCol || ''}')">
+                htmlParts.push('<div class="lineage-arrow" style="color:var(--green)">↓ migrates to</div>');
+                htmlParts.push(`<div class="lineage-box target clickable" onclick="navigateTo('new','${targetTable}','${targetCol || ''}')">
                     <div class="lineage-label">Target (Tenant DB) <span style="font-size:8px;color:var(--blue)">→ click to view</span></div>
                     <div class="lineage-value">${col.target}</div>
-                </div>`;
+                </div>`);
                 
                 if (col.sql) {
-                    html += `<div class="sql-label">Migration SQL</div>
-                        <div class="sql-box">${col.sql}</div>`;
+                    htmlParts.push(`<div class="sql-label">Migration SQL</div>
+                        <div class="sql-box">${col.sql}</div>`);
                 }
             }
         } else if (col.deprecated) {
-            html += '<div class="lineage-arrow" style="color:var(--red)">✕ deprecated</div>';
-            html += `<div class="lineage-box deprecated">
+            htmlParts.push('<div class="lineage-arrow" style="color:var(--red)">✕ deprecated</div>');
+            htmlParts.push(`<div class="lineage-box deprecated">
                 <div class="lineage-label">Not Migrated</div>
                 <div class="reason">${col.reason || 'Field will be deprecated in new schema'}</div>
-            </div>`;
+            </div>`);
         }
     } else {
         // New/Central schema: show where it comes FROM
@@ -1543,19 +2078,21 @@ function selectColumn(tableName, colName) {
             }
             
             const srcLabel = srcView === 'new' ? 'Tenant DB' : 'Old Schema';
-            html += '<div class="lineage-arrow" style="color:var(--orange)">↑ source from</div>';
-            html += `<div class="lineage-box source clickable" onclick="navigateTo('${srcView}','${srcTable}','${srcCol || ''}')">
+            htmlParts.push('<div class="lineage-arrow" style="color:var(--orange)">↑ source from</div>');
+            htmlParts.push(`<div class="lineage-box source clickable" onclick="navigateTo('${srcView}','${srcTable}','${srcCol || ''}')">
                 <div class="lineage-label">Source (${srcLabel}) <span style="font-size:8px;color:var(--blue)">→ click to view</span></div>
                 <div class="lineage-value">${srcTable}.${srcCol || src}</div>
-            </div>`;
+            </div>`);
         } else {
-            html += `<div style="font-size:10px;color:var(--dim);margin-top:8px;font-style:italic">New field - no source mapping</div>`;
+            htmlParts.push(`<div style="font-size:10px;color:var(--dim);margin-top:8px;font-style:italic">New field - no source mapping</div>`);
         }
     }
     
-    document.getElementById('migrationPanel').innerHTML = html;
+    document.getElementById('migrationPanel').innerHTML = htmlParts.join('');
 }
 
+let pendingScroll = null; // Frame that scrolls navigateTo's target into view
+
 function navigateTo(view, tableName, colName) {
     // Check if table exists in target view
     const targetSchema = schemaData[view] || {};
@@ -1574,37 +2111,33 @@ function navigateTo(view, tableName, colName) {
     // Update everything
     selectedTable = tableName;
     renderLegend();
-    renderGraph();
+    renderGraph(); // synchronous: the scroll below looks up the new node
     showPanel(tableName);
     
-    // Scroll the graph to show the selected table
-    setTimeout(() => {
+    // Scroll on the next frame; a burst of clicks only scrolls to the last target
+    if (pendingScroll) cancelAnimationFrame(pendingScroll);
+    pendingScroll = requestAnimationFrame(() => {
+        pendingScroll = null;
+        
+        // Scroll the graph to show the selected table
         const selectedNode = document.querySelector('.node.selected');
         if (selectedNode) {
             selectedNode.scrollIntoView({ behavior: 'smooth', block: 'center', inline: 'center' });
         }
-    }, 50);
-    
-    // Highlight and show specific column if provided
-    if (colName) {
-        setTimeout(() => {
+        
+        // Highlight and show specific column if provided
+        if (colName) {
             selectColumn(tableName, colName);
-            // Scroll the column into view
-            const colItems = document.querySelectorAll('.col-item');
-            colItems.forEach(item => {
-                const nameEl = item.querySelector('.col-name');
-                if (nameEl && nameEl.textContent === colName) {
-                    item.scrollIntoView({ behavior: 'smooth', block: 'center' });
-                }
-            });
-        }, 100);
-    }
+            // Scroll the column's row (found by selectColumn) into view
+            if (selectedColEl) selectedColEl.scrollIntoView({ behavior: 'smooth', block: 'center' });
+        }
+    });
 }
 
 function closePanel() {
     document.getElementById('detailPanel').classList.add('collapsed');
     selectedTable = null;
-    renderGraph();
+    scheduleRender();
 }
 
 // Tab switching
@@ -1616,7 +2149,7 @@ document.querySelectorAll('.tab').forEach(tab => {
         selectedTable = null;
         document.getElementById('detailPanel').classList.add('collapsed');
         renderLegend();
-        renderGraph();
+        scheduleRender();
     });
 });
 
@@ -1624,57 +2157,73 @@ document.querySelectorAll('.tab').forEach(tab => {
 let fkTooltip = null;
 let currentHoverPath = null;
 let currentHoverTables = [];
+let fkTooltipTarget = null; // Hover path the tooltip content was built for
+let fkTooltipPos = null; // Latest pointer position, applied on the next frame
+let fkTooltipFrame = null;
+
+function moveFKTooltip() {
+    fkTooltipFrame = null;
+    fkTooltip.style.left = fkTooltipPos.x + 'px';
+    fkTooltip.style.top = fkTooltipPos.y + 'px';
+}
 
 function showFKTooltip(event, element) {
-    const fromTable = element.dataset.fromTable;
-    const fromCol = element.dataset.fromCol;
-    const fromType = element.dataset.fromType;
-    const toTable = element.dataset.toTable;
-    const toCol = element.dataset.toCol;
-    const toType = element.dataset.toType;
-    const relationship = element.dataset.relationship;
-    
-    // Highlight the visible FK line (next sibling of invisible hover path)
-    const visiblePath = element.nextElementSibling;
-    if (visiblePath && visiblePath.classList.contains('fk-line')) {
-        currentHoverPath = visiblePath;
-        visiblePath.classList.add('hovered');
-    }
-    
-    // Highlight the connected table nodes
-    const fromNode = document.querySelector(`.node[onclick*="'${fromTable}'"]`);
-    const toNode = document.querySelector(`.node[onclick*="'${toTable}'"]`);
-    if (fromNode) {
-        fromNode.classList.add('fk-connected');
-        currentHoverTables.push(fromNode);
-    }
-    if (toNode) {
-        toNode.classList.add('fk-connected');
-        currentHoverTables.push(toNode);
-    }
-    
-    if (!fkTooltip) {
-        fkTooltip = document.createElement('div');
-        fkTooltip.className = 'fk-tooltip';
-        document.body.appendChild(fkTooltip);
+    // Runs on every mousemove: only the position changes while the pointer
+    // stays on the same arrow, and that is written once per frame
+    fkTooltipPos = { x: event.pageX + 15, y: event.pageY + 15 };
+    if (element !== fkTooltipTarget) {
+        if (fkTooltipTarget) hideFKTooltip();
+        fkTooltipTarget = element;
+        
+        // Read everything first...
+        const { fromTable, fromCol, fromType, toTable, toCol, toType, relationship } = element.dataset;
+        const visiblePath = element.nextElementSibling;
+        const fromNode = getNode(fromTable);
+        const toNode = getNode(toTable);
+        
+        // ...then write: highlight the visible FK line (next sibling of the
+        // invisible hover path) and the connected table nodes
+        if (visiblePath && visiblePath.classList.contains('fk-line')) {
+            currentHoverPath = visiblePath;
+            visiblePath.classList.add('hovered');
+        }
+        if (fromNode) {
+            fromNode.classList.add('fk-connected');
+            currentHoverTables.push(fromNode);
+        }
+        if (toNode) {
+            toNode.classList.add('fk-connected');
+            currentHoverTables.push(toNode);
+        }
+        
+        if (!fkTooltip) {
+            fkTooltip = document.createElement('div');
+            fkTooltip.className = 'fk-tooltip';
+            document.body.appendChild(fkTooltip);
+        }
+        
+        fkTooltip.innerHTML = `
+            <div class="tooltip-title">🔗 Foreign Key Relationship</div>
+            <div class="tooltip-row"><span class="tooltip-label">From:</span> <strong>${fromTable}.${fromCol}</strong> (${fromType})</div>
+            <div class="tooltip-row"><span class="tooltip-label">To:</span> <strong>${toTable}.${toCol}</strong> (${toType})</div>
+            <div class="tooltip-row"><span class="tooltip-label">Cardinality:</span> <strong>${relationship}</strong> (Many-to-One)</div>
+            <div class="tooltip-row" style="margin-top:4px;color:var(--dim);font-size:9px;">
+                ↑ Many rows in <strong>${fromTable}</strong> can reference one row in <strong>${toTable}</strong>
+            </div>
+        `;
+        fkTooltip.style.display = 'block';
+        moveFKTooltip(); // place it right away rather than a frame late
+        return;
     }
-    
-    fkTooltip.innerHTML = `
-        <div class="tooltip-title">🔗 Foreign Key Relationship</div>
-        <div class="tooltip-row"><span class="tooltip-label">From:</span> <strong>${fromTable}.${fromCol}</strong> (${fromType})</div>
-        <div class="tooltip-row"><span class="tooltip-label">To:</span> <strong>${toTable}.${toCol}</strong> (${toType})</div>
-        <div class="tooltip-row"><span class="tooltip-label">Cardinality:</span> <strong>${relationship}</strong> (Many-to-One)</div>
-        <div class="tooltip-row" style="margin-top:4px;color:var(--dim);font-size:9px;">
-            ↑ Many rows in <strong>${fromTable}</strong> can reference one row in <strong>${toTable}</strong>
-        </div>
-    `;
-    
-    fkTooltip.style.display = 'block';
-    fkTooltip.style.left = (event.pageX + 15) + 'px';
-    fkTooltip.style.top = (event.pageY + 15) + 'px';
+    if (!fkTooltipFrame) fkTooltipFrame = requestAnimationFrame(moveFKTooltip);
 }
 
 function hideFKTooltip() {
+    fkTooltipTarget = null;
+    if (fkTooltipFrame) {
+        cancelAnimationFrame(fkTooltipFrame);
+        fkTooltipFrame = null;
+    }
     if (fkTooltip) {
         fkTooltip.style.display = 'none';
     }
@@ -1690,13 +2239,51 @@ function hideFKTooltip() {
     currentHoverTables = [];
 }
 
-// Persistent highlight state (cleared on click elsewhere)
+// Persistent highlight state (cleared on click elsewhere): the elements
+// currently marked, and which FK / PK column they are for so renderGraph can
+// keep them drawn and mark them again
 let persistentHighlights = { arrows: [], tables: [] };
+let pinnedHighlight = null; // { view, end: 'from' | 'to', table, column, tables }
+
+function isPinnedRelation(pin, rel) {
+    return pin.end === 'from'
+        ? rel.from_table === pin.table && rel.from_col === pin.column
+        : rel.to_table === pin.table && rel.to_col === pin.column;
+}
 
 function clearPersistentHighlights() {
     persistentHighlights.arrows.forEach(arrow => arrow.classList.remove('hovered'));
     persistentHighlights.tables.forEach(table => table.classList.remove('fk-connected'));
     persistentHighlights = { arrows: [], tables: [] };
+    pinnedHighlight = null;
+}
+
+// Mark the pinned highlight's rendered arrows and tables. Returns false when
+// some of them were culled by the last render, so a new one is needed.
+function applyPinnedHighlight() {
+    const pin = pinnedHighlight;
+    if (!pin || pin.view !== currentView) return true;
+    
+    const arrows = getFkLines(pin.end, pin.table, pin.column).slice();
+    const tables = pin.tables.map(getNode).filter(Boolean);
+    arrows.forEach(arrow => arrow.classList.add('hovered'));
+    tables.forEach(node => node.classList.add('fk-connected'));
+    persistentHighlights = { arrows, tables };
+    
+    const positions = layoutCache[currentView]?.positions || {};
+    const expectedArrows = (fkRelations[currentView] || []).filter(rel =>
+        isPinnedRelation(pin, rel) && positions[rel.from_table] && positions[rel.to_table]).length;
+    return arrows.length >= expectedArrows &&
+        pin.tables.every(name => !positions[name] || !schemaData[currentView]?.[name] || getNode(name));
+}
+
+function pinHighlight(end, tableName, columnName, tables) {
+    pinnedHighlight = { view: currentView, end, table: tableName, column: columnName, tables };
+    // Culled arrows or tables are drawn by a fresh render, which re-applies this
+    if (!applyPinnedHighlight()) scheduleRender();
+    
+    // Scroll to the graph if needed
+    document.getElementById('graphPanel').scrollIntoView({ behavior: 'smooth', block: 'center' });
 }
 
 function highlightFKRelation(tableName, columnName) {
@@ -1705,7 +2292,7 @@ function highlightFKRelation(tableName, columnName) {
     // Find the FK relationship for this column
     const schema = schemaData[currentView];
     const table = schema?.[tableName];
-    const column = table?.columns?.find(c => c.name === columnName);
+    const column = getColumn(table, columnName);
     
     if (!column || !column.fk || !column.fk_ref) {
         return;
@@ -1713,89 +2300,24 @@ function highlightFKRelation(tableName, columnName) {
     
     const [refTable, refCol] = column.fk_ref;
     
-    // Find all FK arrows from this table.column to referenced table
-    const allInvisiblePaths = document.querySelectorAll('path[stroke="transparent"]');
-    
-    allInvisiblePaths.forEach(invisiblePath => {
-        const fromTable = invisiblePath.getAttribute('data-from-table');
-        const fromCol = invisiblePath.getAttribute('data-from-col');
-        
-        if (fromTable === tableName && fromCol === columnName) {
-            // Find the visible path (next element sibling)
-            let visiblePath = invisiblePath.nextElementSibling;
-            
-            // Skip text nodes and find the actual path element
-            while (visiblePath && visiblePath.nodeType !== 1) {
-                visiblePath = visiblePath.nextSibling;
-            }
-            
-            if (visiblePath && visiblePath.tagName === 'path' && visiblePath.classList.contains('fk-line')) {
-                visiblePath.classList.add('hovered');
-                persistentHighlights.arrows.push(visiblePath);
-            }
-        }
-    });
-    
-    // Highlight the connected tables
-    const fromNode = document.querySelector(`[data-table="${tableName}"]`);
-    const toNode = document.querySelector(`[data-table="${refTable}"]`);
-    
-    if (fromNode) {
-        fromNode.classList.add('fk-connected');
-        persistentHighlights.tables.push(fromNode);
-    }
-    if (toNode) {
-        toNode.classList.add('fk-connected');
-        persistentHighlights.tables.push(toNode);
-    }
-    
-    // Scroll to the graph if needed
-    document.getElementById('graphPanel').scrollIntoView({ behavior: 'smooth', block: 'center' });
+    // The FK arrows from this table.column, this table and the referenced one
+    pinHighlight('from', tableName, columnName, [tableName, refTable]);
 }
 
 function highlightPKRelations(tableName, columnName) {
     clearPersistentHighlights();
     
-    // Find all FK arrows that reference this PK
-    const allInvisiblePaths = document.querySelectorAll('path[stroke="transparent"]');
-    
-    allInvisiblePaths.forEach(invisiblePath => {
-        const toTable = invisiblePath.getAttribute('data-to-table');
-        const toCol = invisiblePath.getAttribute('data-to-col');
-        
-        if (toTable === tableName && toCol === columnName) {
-            // Find the visible path (next element sibling)
-            let visiblePath = invisiblePath.nextElementSibling;
-            
-            // Skip text nodes and find the actual path element
-            while (visiblePath && visiblePath.nodeType !== 1) {
-                visiblePath = visiblePath.nextSibling;
-            }
-            
-            if (visiblePath && visiblePath.tagName === 'path' && visiblePath.classList.contains('fk-line')) {
-                visiblePath.classList.add('hovered');
-                persistentHighlights.arrows.push(visiblePath);
-                
-                // Also highlight the source table
-                const fromTable = invisiblePath.getAttribute('data-from-table');
-                const fromNode = document.querySelector(`[data-table="${fromTable}"]`);
-                if (fromNode && !persistentHighlights.tables.includes(fromNode)) {
-                    fromNode.classList.add('fk-connected');
-                    persistentHighlights.tables.push(fromNode);
-                }
-            }
+    // The FK arrows that reference this PK, their source tables, and the PK
+    // table itself
+    const tables = [];
+    (fkRelations[currentView] || []).forEach(rel => {
+        if (rel.to_table === tableName && rel.to_col === columnName && !tables.includes(rel.from_table)) {
+            tables.push(rel.from_table);
         }
     });
+    if (!tables.includes(tableName)) tables.push(tableName);
     
-    // Highlight the PK table itself
-    const pkNode = document.querySelector(`[data-table="${tableName}"]`);
-    if (pkNode && !persistentHighlights.tables.includes(pkNode)) {
-        pkNode.classList.add('fk-connected');
-        persistentHighlights.tables.push(pkNode);
-    }
-    
-    // Scroll to the graph if needed
-    document.getElementById('graphPanel').scrollIntoView({ behavior: 'smooth', block: 'center' });
+    pinHighlight('to', tableName, columnName, tables);
 }
 
 // Clear highlights when clicking elsewhere
@@ -1810,15 +2332,126 @@ document.addEventListener('click', function(event) {
 
 renderLegend();
 renderGraph();
+
+// Lay out the other views while the browser is idle, so switching tabs
+// doesn't have to run the layout on click
+const whenIdle = callback => window.requestIdleCallback ? requestIdleCallback(callback) : setTimeout(callback, 200);
+Object.keys(schemaData).forEach(view => {
+    if (view !== currentView) whenIdle(() => layoutTables(schemaData[view], view));
+});
 </script>
 </body>
 </html>'''
+
+# The same chunks as UTF-8, encoded once so the page can be written as bytes
+_HTML_CHUNKS = tuple(chunk.encode('utf-8') for chunk in (
+    _HTML_HEAD, _HTML_BEFORE_FK_RELATIONS, _HTML_BEFORE_REVERSE_MAPPINGS, _HTML_TAIL))
+
+
+# Boolean column fields, packed into one int per column in the page payload
+# (bit values match COLUMN_FLAG_BITS in the page script)
+_COLUMN_FLAG_BITS = {'pk': 1, 'uk': 2, 'fk': 4, 'auto': 8, 'deprecated': 16}
+
+
+def _pack_columns(columns):
+    """
+    Lay a table's columns out as one array per field for the page payload.
+    
+    Saves repeating every key for every column; the page script rebuilds the
+    column objects on load. Columns that don't all share the same set of
+    fields are passed through unchanged.
+    """
+    rows = [col.to_dict() if isinstance(col, Column) else col for col in columns]
+    keys = list(rows[0]) if rows else []
+    if any(len(row) != len(keys) or any(key not in row for key in keys) for row in rows):
+        return rows
+    packed = {'keys': keys, 'flags': [0] * len(rows)}
+    flags = packed['flags']
+    for key in keys:
+        bit = _COLUMN_FLAG_BITS.get(key)
+        if bit is None:
+            packed[key] = [row[key] for row in rows]
+            continue
+        for i, row in enumerate(rows):
+            if row[key]:
+                flags[i] |= bit
+    return packed
+
+
+def _pack_tables(tables):
+    """Copy of a parsed schema with each table's columns packed by _pack_columns."""
+    return {name: dict(table, columns=_pack_columns(table['columns'])) if 'columns' in table else table
+            for name, table in tables.items()}
+
+
+def _fk_dicts(relations):
+    """Expand FKRelation tuples into the dicts the page script expects."""
+    return [rel._asdict() if isinstance(rel, FKRelation) else rel for rel in relations]
+
+
+def _json_default(obj):
+    """Serialize Column objects as plain dicts."""
+    if isinstance(obj, Column):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dump_compact(obj):
+    """
+    Serialize data embedded in the page to UTF-8 JSON bytes.
+    
+    The browser parses it, nobody reads it, so no whitespace; orjson already
+    produces bytes, which go into the output file without a decode/encode trip.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=_json_default, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def generate_html(old_tables, new_tables, central_tables, old_fk_relations, new_fk_relations, central_fk_relations, reverse_mappings=None, github_repo=None):
+    """Generate the complete HTML file with bidirectional relationship support."""
+    buf = io.BytesIO()
+    _write_html(buf, old_tables, new_tables, central_tables, old_fk_relations, new_fk_relations,
+                central_fk_relations, reverse_mappings, github_repo)
+    return buf.getvalue().decode('utf-8')
+
+
+def _write_html(fp, old_tables, new_tables, central_tables, old_fk_relations, new_fk_relations, central_fk_relations, reverse_mappings=None, github_repo=None):
+    """
+    Write the diagram HTML to a binary file object piece by piece.
+    
+    The page is emitted as template chunks interleaved with the embedded JSON
+    payloads, so the full document never has to exist as one string.
+    """
     
-    return html
+    all_data = {
+        'old': _pack_tables(old_tables),
+        'new': _pack_tables(new_tables),
+        'central': _pack_tables(central_tables)
+    }
+    
+    all_fk = {
+        'old': _fk_dicts(old_fk_relations),
+        'new': _fk_dicts(new_fk_relations),
+        'central': _fk_dicts(central_fk_relations)
+    }
+    
+    # Add reverse mappings for bidirectional navigation
+    if reverse_mappings is None:
+        reverse_mappings = {'tenant': {}, 'central': {}}
+    
+    head, before_fk_relations, before_reverse_mappings, tail = _HTML_CHUNKS
+    fp.write(head)
+    fp.write(_dump_compact(all_data))
+    fp.write(before_fk_relations)
+    fp.write(_dump_compact(all_fk))
+    fp.write(before_reverse_mappings)
+    fp.write(_dump_compact(reverse_mappings))
+    fp.write(tail)
 
 
 def build_diagram(old_schema=None, tenant_schema=None, central_schema=None, 
-                  mappings=None, output=None, github_repo=None):
+                  mappings=None, output=None, github_repo=None, use_cache=True):
     """
     Build an interactive schema migration diagram
     
@@ -1829,19 +2462,18 @@ def build_diagram(old_schema=None, tenant_schema=None, central_schema=None,
         mappings (str): Path to field mappings JSON file
         output (str): Path for output HTML file
         github_repo (str, optional): GitHub repo for issues (format: owner/repo)
+        use_cache (bool): Reuse parsed schemas cached from earlier runs
     
     Returns:
         str: Path to generated HTML file
     """
     # Default paths (for backward compatibility)
     if old_schema is None:
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        repo_root = os.path.dirname(os.path.dirname(script_dir))
-        old_schema = os.path.join(repo_root, 'schemas', 'old', 'schema.sql')
-        tenant_schema = os.path.join(repo_root, 'schemas', 'new', 'tenant_schema.sql')
-        central_schema = os.path.join(repo_root, 'schemas', 'new', 'central_schema.sql')
-        mappings = os.path.join(repo_root, 'scripts', 'field_mappings.json')
-        output = os.path.join(repo_root, 'tools', 'schema_diagram.html')
+        old_schema = _REPO_ROOT / 'schemas' / 'old' / 'schema.sql'
+        tenant_schema = _REPO_ROOT / 'schemas' / 'new' / 'tenant_schema.sql'
+        central_schema = _REPO_ROOT / 'schemas' / 'new' / 'central_schema.sql'
+        mappings = _REPO_ROOT / 'scripts' / 'field_mappings.json'
+        output = _DEFAULT_OUTPUT
     
     old_path = old_schema
     new_path = tenant_schema
@@ -1850,18 +2482,12 @@ def build_diagram(old_schema=None, tenant_schema=None, central_schema=None,
     
     print("Parsing SQL schema files...")
     
-    with open(old_path, 'r') as f:
-        old_sql = f.read()
-    with open(new_path, 'r') as f:
-        new_sql = f.read()
-    with open(central_path, 'r') as f:
-        central_sql = f.read()
-    with open(mappings_path, 'r') as f:
-        mappings_data = json.load(f)
+    with open(mappings_path, 'rb') as f:
+        mappings_data = orjson.loads(f.read()) if orjson is not None else json.load(f)
     
-    old_tables, old_fk = parse_sql_schema(old_sql, 'old')
-    new_tables, new_fk = parse_sql_schema(new_sql, 'new')
-    central_tables, central_fk = parse_sql_schema(central_sql, 'central')
+    parse = parse_sql_schema_cached if use_cache else parse_sql_schema_file
+    (old_tables, old_fk), (new_tables, new_fk), (central_tables, central_fk) = _parse_schema_files(
+        [(old_path, 'old'), (new_path, 'new'), (central_path, 'central')], parse)
     
     print(f"  Old schema: {len(old_tables)} tables, {sum(len(t['columns']) for t in old_tables.values())} columns, {len(old_fk)} FK relations")
     print(f"  New tenant: {len(new_tables)} tables, {sum(len(t['columns']) for t in new_tables.values())} columns, {len(new_fk)} FK relations")
@@ -1880,24 +2506,27 @@ def build_diagram(old_schema=None, tenant_schema=None, central_schema=None,
     # Pass full mappings_data (not filtered) so _new_table_sources is available
     reverse_mappings = generate_reverse_mappings(mappings_data)
     
-    # Count mappings
-    mapped = sum(1 for t in old_tables.values() for c in t['columns'] if c.get('target'))
-    deprecated = sum(1 for t in old_tables.values() for c in t['columns'] if c.get('deprecated'))
+    # Count mappings (one pass over the old columns for both counts)
+    mapped = deprecated = 0
+    for table_data in old_tables.values():
+        for col in table_data['columns']:
+            if col.target:
+                mapped += 1
+            if col.deprecated:
+                deprecated += 1
     print(f"  Mapped fields: {mapped}")
     print(f"  Deprecated fields: {deprecated}")
     
-    # Generate HTML
-    html = generate_html(old_tables, new_tables, central_tables, old_fk, new_fk, central_fk, reverse_mappings, github_repo)
-    
     # Use provided output path or default
     if output is None:
-        output = os.path.join(repo_root, 'tools', 'schema_diagram.html')
+        output = _DEFAULT_OUTPUT
     
     # Ensure output directory exists
     os.makedirs(os.path.dirname(output), exist_ok=True)
     
-    with open(output, 'w') as f:
-        f.write(html)
+    # Generate HTML straight into the output file
+    with open(output, 'wb') as f:
+        _write_html(f, old_tables, new_tables, central_tables, old_fk, new_fk, central_fk, reverse_mappings, github_repo)
     
     print(f"\n✅ Generated: {output}")
     return output
@@ -5,7 +5,7 @@ import argparse
 import sys
 import os
 from pathlib import Path
-from .builder import build_diagram
+from . import __version__
 
 
 def main():
@@ -53,10 +53,16 @@ For more information, visit: https://github.com/YOUR_USERNAME/schema-migrator
         help="GitHub repo for issues integration (format: owner/repo)"
     )
     
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-parse schema files instead of reusing cached results"
+    )
+    
     parser.add_argument(
         "--version",
         action="version",
-        version="%(prog)s 1.0.0"
+        version=f"%(prog)s {__version__}"
     )
     
     args = parser.parse_args()
@@ -120,7 +126,8 @@ def build_project(args):
         print("   Run 'schema-migrator init' to create example project")
         sys.exit(1)
     
-    # Build diagram
+    # Build diagram (imported here so --help/--version don't load the builder)
+    from .builder import build_diagram
     try:
         output_path = build_diagram(
             old_schema=str(schemas_dir / "old" / "schema.sql"),
@@ -128,7 +135,8 @@ def build_project(args):
             central_schema=str(schemas_dir / "new" / "central_schema.sql"),
             mappings=str(mappings_file),
             output=args.output,
-            github_repo=args.github_repo
+            github_repo=args.github_repo,
+            use_cache=not args.no_cache
         )
         
         print(f"\n✅ Generated: {output_path}")
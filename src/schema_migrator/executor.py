@@ -14,22 +14,79 @@ Key Features:
 - Production-grade error handling and logging
 """
 
+import functools
 import json
+import os
 import re
 import logging
-from typing import Dict, List, Optional, Any, Tuple
-from datetime import datetime
+import tempfile
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional, Any, Tuple
+from datetime import date, datetime
+from decimal import Decimal
 import pymysql
 
+try:
+    import orjson  # optional: faster mapping loads
+except ImportError:
+    orjson = None
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Used to find the source columns an sql/condition expression may read
+_QUOTED_LITERAL_RE = re.compile(r"'[^']*'|\"[^\"]*\"")
+_IDENTIFIER_RE = re.compile(r'\w+')
+
+# Used to compile sql transforms
+_SELECT_COLUMN_RE = re.compile(r'SELECT\s+(\w+)', re.IGNORECASE)
+# Lookahead, so the next WHEN isn't consumed
+_CASE_WHEN_RE = re.compile(r'WHEN\s+(.+?)\s+THEN\s+(.+?)(?=\s+WHEN|\s+ELSE|\s+END)', re.IGNORECASE | re.DOTALL)
+_CASE_ELSE_RE = re.compile(r'ELSE\s+(.+?)\s+END', re.IGNORECASE | re.DOTALL)
+_CASE_END_RE = re.compile(r'\bEND\s*$', re.IGNORECASE)
+_CASE_BRANCH_RE = re.compile(r'\bWHEN\b.+?\bTHEN\b', re.IGNORECASE | re.DOTALL)
+
+
+@functools.lru_cache(maxsize=None)
+def _quote_ident(name: str) -> str:
+    """Backtick-quote a MySQL identifier, rejecting ones MySQL can't hold.
+
+    Every database, table and column name interpolated into SQL goes
+    through here; the cache makes that free after the first use.
+    """
+    if not isinstance(name, str) or not name or len(name) > 64 or '\x00' in name:
+        raise ValueError(f"Invalid SQL identifier: {name!r}")
+    return '`' + name.replace('`', '``') + '`'
+
+
+class FieldTarget:
+    """
+    One source field's mapping onto one target column.
+
+    Slotted rather than a dict: ``_build_values_fn`` reads every field of
+    every target it compiles.
+    """
+    __slots__ = ('old_field', 'new_field', 'sql', 'condition', 'lookup_chain')
+
+    def __init__(self, old_field, new_field, sql=None, condition=None, lookup_chain=None):
+        self.old_field = old_field
+        self.new_field = new_field
+        self.sql = sql
+        self.condition = condition
+        self.lookup_chain = lookup_chain
+
+
+def _qualified(db_name: str, table_name: str) -> str:
+    """``db``.``table``, so no statement depends on the connection's current DB."""
+    return f"{_quote_ident(db_name)}.{_quote_ident(table_name)}"
+
 
 class MigrationExecutor:
     """Execute database migrations from field_mappings.json"""
     
     def __init__(self, mappings_file: str, source_conn, source_db: str, central_db: str = 'central_database',
-                 progress_callback=None):
+                 progress_callback=None, target_conn_factory: Optional[Callable[[str], Any]] = None,
+                 bulk_load: bool = False, push_down: bool = False):
         """
         Initialize migration executor.
         
@@ -40,20 +97,55 @@ class MigrationExecutor:
             central_db: Central database name
             progress_callback: Optional callback(tables_done, tables_total, current_table)
                                called after each table is migrated.
+            target_conn_factory: Optional callable(db_name) returning a PyMySQL
+                               connection for a target database.  Each target
+                               DB gets one connection, opened on first use.
+                               Default: write through ``source_conn``.
+            bulk_load: Use ``LOAD DATA LOCAL INFILE`` instead of multi-row
+                       INSERT for batch-inserted tables that have no unique
+                       keys.  Target connections must be opened with
+                       ``local_infile=True``; on any failure the batch
+                       falls back to INSERT.
+            push_down: Copy targets made only of plain column mappings with
+                       one ``INSERT ... SELECT`` when the target database is
+                       on the source server (see ``_push_down_target``).
         """
         self.source_conn = source_conn
         self.source_db = source_db
         self.central_db = central_db
         self.progress_callback = progress_callback
+        self.target_conn_factory = target_conn_factory
+        self.bulk_load = bulk_load
+        self.push_down = push_down
+
+        # Open target connections: {db_name -> connection}
+        self._target_conns: Dict[str, Any] = {}
+        self._foreign_key_checks = True
         
-        with open(mappings_file, 'r') as f:
-            self.mappings = json.load(f)
+        with open(mappings_file, 'rb') as f:
+            self.mappings = orjson.loads(f.read()) if orjson is not None else json.load(f)
         
         # Cache for unique constraint detection: {db_name.table_name: [unique_columns]}
         self.unique_constraints_cache: Dict[str, List[List[str]]] = {}
 
         # Cache for column-existence checks: {"db.table.col" -> bool}
         self._column_exists_cache: Dict[str, bool] = {}
+
+        # Grouped + sorted targets: {(old_table, db_type) -> [(table, field_list)]}
+        self._ordered_targets_cache: Dict[Tuple[str, str], List[Tuple[str, List[FieldTarget]]]] = {}
+
+        # Whether each target DB lives on the source server: {db_name -> bool}
+        self._same_server_cache: Dict[str, bool] = {}
+
+        # Source table columns, and the subset each mapping reads
+        self._source_columns_cache: Dict[str, List[str]] = {}
+        self._projection_cache: Dict[str, Optional[List[str]]] = {}
+
+        # Compiled ``sql`` transforms: {expression -> callable(row)}
+        self._transform_cache: Dict[str, Callable[[Dict], Any]] = {}
+
+        # Compiled ``condition`` expressions: {expression -> callable(row)}
+        self._condition_cache: Dict[str, Callable[[Dict], bool]] = {}
         
         # Universal ID mapping cache: { 'table_name': { 'lookup_column': { old_value: new_id } } }
         self.id_mappings = {}
@@ -63,7 +155,69 @@ class MigrationExecutor:
         
         # Row-level error tracking: [{table, row_id, error, row_snapshot}, ...]
         self.skipped_rows: List[Dict[str, Any]] = []
+
+        self._validate_mappings()
     
+    def _validate_mappings(self):
+        """Check every ``targets`` entry and compile its ``sql`` up front.
+
+        Raises:
+            ValueError: naming the table and field of the first malformed
+                entry, instead of failing part-way through a migration.
+        """
+        for old_table, field_mappings in self.mappings.items():
+            if old_table.startswith('_'):
+                continue
+            if not isinstance(field_mappings, dict):
+                raise ValueError(f"Invalid mapping for table '{old_table}': expected an object")
+
+            for old_field, mapping in field_mappings.items():
+                if old_field.startswith('_') or not isinstance(mapping, dict) or 'targets' not in mapping:
+                    continue
+                where = f"{old_table}.{old_field}"
+                targets = mapping['targets']
+                if not isinstance(targets, list):
+                    raise ValueError(f"Invalid mapping for {where}: 'targets' must be a list")
+
+                for i, target in enumerate(targets):
+                    if not isinstance(target, dict):
+                        raise ValueError(f"Invalid mapping for {where}: targets[{i}] must be an object")
+                    for key in ('table', 'column'):
+                        try:
+                            # Type-checked first: lru_cache hashes the argument
+                            # before _quote_ident can reject a list or dict
+                            if not isinstance(target.get(key), str):
+                                raise ValueError
+                            _quote_ident(target[key])
+                        except ValueError:
+                            raise ValueError(
+                                f"Invalid mapping for {where}: targets[{i}] has no valid '{key}'"
+                            ) from None
+
+                    lookup_chain = target.get('lookup_chain')
+                    if lookup_chain is not None and not (
+                        isinstance(lookup_chain, list) and all(isinstance(step, dict) for step in lookup_chain)
+                    ):
+                        raise ValueError(
+                            f"Invalid mapping for {where}: targets[{i}].lookup_chain must be a list of objects"
+                        )
+
+                    condition = target.get('condition')
+                    if condition and isinstance(condition, str):
+                        self._get_compiled_condition(condition)
+
+                    sql = target.get('sql')
+                    if not sql or not isinstance(sql, str) or 'INSERT INTO' in sql.upper():
+                        continue
+                    stripped = sql.strip()
+                    if stripped.upper().startswith('CASE') and (
+                        not _CASE_END_RE.search(stripped) or not _CASE_BRANCH_RE.search(stripped)
+                    ):
+                        raise ValueError(
+                            f"Invalid mapping for {where}: targets[{i}].sql is not a complete CASE WHEN ... END"
+                        )
+                    self._get_compiled_transform(sql)
+
     def migrate_site(
         self,
         site_info: Dict[str, Any],
@@ -116,11 +270,7 @@ class MigrationExecutor:
         
         # Disable FK checks for the duration of data migration
         # (re-enabled in the finally block below)
-        try:
-            with self.source_conn.cursor() as cursor:
-                cursor.execute("SET FOREIGN_KEY_CHECKS = 0")
-        except Exception:
-            pass  # Best-effort; some connections may not support this
+        self._set_foreign_key_checks(False)
 
         # Step 3: Migrate each table
         try:
@@ -180,11 +330,7 @@ class MigrationExecutor:
                     logger.debug(f"Traceback:\n{traceback_str[:500]}")
         finally:
             # Re-enable FK checks regardless of success/failure
-            try:
-                with self.source_conn.cursor() as cursor:
-                    cursor.execute("SET FOREIGN_KEY_CHECKS = 1")
-            except Exception:
-                pass
+            self._set_foreign_key_checks(True)
         
         logger.info(f"✅ Migration complete for {username}")
         logger.info(f"Rows migrated: {stats['total_rows']}")
@@ -193,12 +339,40 @@ class MigrationExecutor:
         stats['skipped_rows'] = self.skipped_rows
         return stats
     
+    def _target_conn(self, db_name: str):
+        """Connection that writes to *db_name* (``source_conn`` unless a
+        ``target_conn_factory`` was given)."""
+        if self.target_conn_factory is None:
+            return self.source_conn
+        conn = self._target_conns.get(db_name)
+        if conn is None:
+            conn = self._target_conns[db_name] = self.target_conn_factory(db_name)
+            if not self._foreign_key_checks:
+                self._execute_best_effort(conn, "SET FOREIGN_KEY_CHECKS = 0")
+        return conn
+
+    def _set_foreign_key_checks(self, enabled: bool):
+        """Toggle FOREIGN_KEY_CHECKS on the source and every target connection."""
+        self._foreign_key_checks = enabled
+        sql = f"SET FOREIGN_KEY_CHECKS = {1 if enabled else 0}"
+        self._execute_best_effort(self.source_conn, sql)
+        for conn in self._target_conns.values():
+            self._execute_best_effort(conn, sql)
+
+    @staticmethod
+    def _execute_best_effort(conn, sql: str):
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute(sql)
+        except Exception:
+            pass  # Best-effort; some connections may not support this
+
     def _register_site_in_central(self, site_info: Dict, tenant_db: str, site_uuid: str):
         """Register site in site_registry (required for FK constraints)."""
-        with self.source_conn.cursor() as cursor:
-            cursor.execute(f"USE `{self.central_db}`")
-            cursor.execute("""
-                INSERT INTO site_registry (
+        conn = self._target_conn(self.central_db)
+        with conn.cursor() as cursor:
+            cursor.execute(f"""
+                INSERT INTO {_qualified(self.central_db, 'site_registry')} (
                     site_uuid, database_name, site_name, site_email,
                     is_active
                 ) VALUES (%s, %s, %s, %s, TRUE)
@@ -211,7 +385,7 @@ class MigrationExecutor:
                 site_info.get('siteName', site_info.get('username')),
                 site_info.get('AdminEmailAddress', '')
             ))
-            self.source_conn.commit()
+            conn.commit()
             logger.info(f"Registered in site_registry")
     
     def _get_migration_order(self) -> List[str]:
@@ -249,10 +423,7 @@ class MigrationExecutor:
         source_table = self._resolve_source_table(old_table)
 
         try:
-            with self.source_conn.cursor(pymysql.cursors.Cursor) as cursor:
-                cursor.execute(f"USE `{self.source_db}`")
-                cursor.execute(f"SHOW COLUMNS FROM `{source_table}`")
-                columns = {row[0] for row in cursor.fetchall()}
+            columns = set(self._get_source_columns(source_table))
         except Exception as e:
             logger.warning(f"Could not check columns for {source_table}: {e}")
             return None
@@ -267,6 +438,16 @@ class MigrationExecutor:
         # No recognised filter column — skip in JSON-driven migration
         return None
     
+    def _get_source_columns(self, source_table: str) -> List[str]:
+        """Column names of a source table (cached; raises if unreadable)."""
+        columns = self._source_columns_cache.get(source_table)
+        if columns is None:
+            with self.source_conn.cursor(pymysql.cursors.Cursor) as cursor:
+                cursor.execute(f"SHOW COLUMNS FROM {_qualified(self.source_db, source_table)}")
+                columns = [row[0] for row in cursor.fetchall()]
+            self._source_columns_cache[source_table] = columns
+        return columns
+
     def migrate_table(
         self, 
         old_table: str, 
@@ -285,41 +466,84 @@ class MigrationExecutor:
         if old_table not in self.mappings:
             return {'migrated': 0, 'skipped': 0, 'errors': 0}
         
-        field_mappings = self.mappings[old_table]
-        
-        # Fetch source data
-        source_rows = self._fetch_source_data(old_table, filters)
-        if not source_rows:
+        # Targets in FK dependency order (checked before fetching: most
+        # tables have no targets in one of the two DB types)
+        ordered_targets = self._get_ordered_targets(old_table, target_db_type)
+        if not ordered_targets:
             return {'migrated': 0, 'skipped': 0, 'errors': 0}
         
-        # Group targets by table
-        target_groups = self._group_targets(field_mappings, target_db_type)
-        if not target_groups:
-            return {'migrated': 0, 'skipped': 0, 'errors': 0}
+        # A single target that can be written while the source result is
+        # still arriving is fed chunk by chunk (see ``_can_stream``)
+        stream = len(ordered_targets) == 1 and self._can_stream(target_db, ordered_targets[0][1])
+
+        # Fetch source data (deferred with push_down: targets copied on
+        # the server never need the rows in Python)
+        source_rows = None
+        if not self.push_down and not stream:
+            source_rows = self._fetch_source_data(old_table, filters)
+            if not source_rows:
+                return {'migrated': 0, 'skipped': 0, 'errors': 0}
         
         stats = {'migrated': 0, 'skipped': 0, 'errors': 0}
         
-        # Sort target tables by FK dependency order
-        sorted_tables = self._sort_targets_by_dependency(list(target_groups.keys()))
-        
-        # Migrate to each target table in dependency order
-        for target_table in sorted_tables:
-            field_list = target_groups[target_table]
-            try:
-                count = self._migrate_to_target(
-                    old_table=old_table,
-                    target_db=target_db,
-                    target_table=target_table,
-                    field_list=field_list,
-                    source_rows=source_rows,
-                    site_uuid=site_uuid,
-                    site_info=site_info
-                )
-                stats['migrated'] += count
-            except Exception as e:
-                logger.error(f"Error migrating to {target_table}: {e}")
-                stats['errors'] += 1
-        
+        # Migrate to each target table in dependency order.  One commit
+        # covers every target of this source table (the insert helpers
+        # leave the transaction open), and it runs even if something
+        # escapes the loop, so pushed-down targets are never left pending.
+        try:
+            for target_table, field_list in ordered_targets:
+                if self.push_down:
+                    pushed = self._push_down_target(
+                        old_table, target_db, target_table, field_list,
+                        filters, site_uuid, site_info,
+                    )
+                    if pushed is not None:
+                        stats['migrated'] += pushed
+                        continue
+                    if source_rows is None and not stream:
+                        source_rows = self._fetch_source_data(old_table, filters)
+                try:
+                    if stream:
+                        # One values function and a running row count
+                        # across every chunk of this target
+                        values_fn = self._build_values_fn(
+                            field_list, old_table, target_table, target_db, site_info, site_uuid,
+                        )
+                        done = 0
+                        try:
+                            for rows in self._iter_source_chunks(old_table, filters):
+                                done += self._migrate_to_target(
+                                    old_table=old_table,
+                                    target_db=target_db,
+                                    target_table=target_table,
+                                    field_list=field_list,
+                                    source_rows=rows,
+                                    site_uuid=site_uuid,
+                                    site_info=site_info,
+                                    values_fn=values_fn,
+                                    rows_before=done,
+                                )
+                        finally:
+                            # Earlier chunks are committed even if a later
+                            # one fails, so they count either way
+                            stats['migrated'] += done
+                    else:
+                        count = self._migrate_to_target(
+                            old_table=old_table,
+                            target_db=target_db,
+                            target_table=target_table,
+                            field_list=field_list,
+                            source_rows=source_rows,
+                            site_uuid=site_uuid,
+                            site_info=site_info
+                        )
+                        stats['migrated'] += count
+                except Exception as e:
+                    logger.error(f"Error migrating to {target_table}: {e}")
+                    stats['errors'] += 1
+        finally:
+            self._target_conn(target_db).commit()
+
         return stats
     
     def _get_fetch_modifiers(self, old_table: str) -> Dict[str, Any]:
@@ -334,8 +558,49 @@ class MigrationExecutor:
         """
         return {'order_by': None, 'limit': None}
 
-    def _fetch_source_data(self, old_table: str, filters: Optional[Dict]) -> List[Dict]:
-        """Fetch source data with filters.
+    def _get_source_projection(self, old_table: str) -> Optional[List[str]]:
+        """Source columns the mappings for *old_table* can read, or ``None``
+        to select every column.
+
+        Collects each mapped field, every identifier in its ``sql`` /
+        ``condition`` expressions, first-step ``lookup_chain`` columns, and
+        ``id`` / ``username`` (used by the id cache and ``user_id``
+        resolution), limited to columns the table really has.
+
+        Override to return ``None`` when a subclass reads source columns
+        that field_mappings.json doesn't mention.
+        """
+        if old_table in self._projection_cache:
+            return self._projection_cache[old_table]
+
+        referenced = {'id', 'username'}
+        for old_field, mapping in self.mappings[old_table].items():
+            if old_field.startswith('_') or not isinstance(mapping, dict):
+                continue
+            referenced.add(old_field)
+            for entry in mapping.get('targets') or [mapping]:
+                for expr in (entry.get('sql'), entry.get('condition')):
+                    if isinstance(expr, str):
+                        referenced.add(expr.strip())
+                        referenced.update(_IDENTIFIER_RE.findall(_QUOTED_LITERAL_RE.sub(' ', expr)))
+                for step in (entry.get('lookup_chain') or []):
+                    referenced.add(step.get('old_column'))
+
+        try:
+            available = self._get_source_columns(self._resolve_source_table(old_table))
+        except Exception:
+            projection = None
+        else:
+            projection = [c for c in available if c in referenced]
+            if not projection or len(projection) == len(available):
+                projection = None
+
+        self._projection_cache[old_table] = projection
+        return projection
+
+    def _source_select_tail(self, old_table: str, filters: Optional[Dict]) -> Tuple[str, list]:
+        """`` FROM ... WHERE ... ORDER BY ... LIMIT ...`` for a source table,
+        with its parameters.
 
         Filter values can be:
         - scalar  → ``WHERE col = %s``
@@ -345,53 +610,114 @@ class MigrationExecutor:
         Uses ``_resolve_source_table`` for the actual table name.
         """
         source_table = self._resolve_source_table(old_table)
-        with self.source_conn.cursor(pymysql.cursors.DictCursor) as cursor:
-            cursor.execute(f"USE `{self.source_db}`")
-            
-            where_clause = ""
-            where_params: list = []
-            if filters:
-                conditions = []
-                for k, v in filters.items():
-                    if isinstance(v, (list, tuple)):
-                        if not v:
-                            continue
-                        # Separate None (SQL NULL) from real values
-                        non_null = [x for x in v if x is not None]
-                        has_null = None in v
-                        parts = []
-                        if non_null:
-                            placeholders = ", ".join(["%s"] * len(non_null))
-                            parts.append(f"`{k}` IN ({placeholders})")
-                            where_params.extend(non_null)
-                        if has_null:
-                            parts.append(f"`{k}` IS NULL")
-                        if parts:
-                            conditions.append(f"({' OR '.join(parts)})")
-                    else:
-                        conditions.append(f"`{k}` = %s")
-                        where_params.append(v)
-                if conditions:
-                    where_clause = " WHERE " + " AND ".join(conditions)
-            
-            mods = self._get_fetch_modifiers(old_table)
-            order_by = mods.get('order_by')
-            limit = mods.get('limit')
 
-            query = f"SELECT * FROM `{source_table}`{where_clause}"
-            if order_by:
-                query += f" ORDER BY {order_by}"
-            if limit:
-                query += f" LIMIT {int(limit)}"
+        where_clause = ""
+        where_params: list = []
+        if filters:
+            conditions = []
+            for k, v in filters.items():
+                if isinstance(v, (list, tuple)):
+                    if not v:
+                        continue
+                    # Separate None (SQL NULL) from real values
+                    non_null = [x for x in v if x is not None]
+                    has_null = None in v
+                    parts = []
+                    if non_null:
+                        placeholders = ", ".join(["%s"] * len(non_null))
+                        parts.append(f"{_quote_ident(k)} IN ({placeholders})")
+                        where_params.extend(non_null)
+                    if has_null:
+                        parts.append(f"{_quote_ident(k)} IS NULL")
+                    if parts:
+                        conditions.append(f"({' OR '.join(parts)})")
+                else:
+                    conditions.append(f"{_quote_ident(k)} = %s")
+                    where_params.append(v)
+            if conditions:
+                where_clause = " WHERE " + " AND ".join(conditions)
+
+        mods = self._get_fetch_modifiers(old_table)
+        order_by = mods.get('order_by')
+        limit = mods.get('limit')
+
+        tail = f" FROM {_qualified(self.source_db, source_table)}{where_clause}"
+        if order_by:
+            tail += f" ORDER BY {order_by}"
+        if limit:
+            tail += f" LIMIT {int(limit)}"
+        return tail, where_params
+
+    def _fetch_source_data(self, old_table: str, filters: Optional[Dict]) -> List[Dict]:
+        """Fetch source data with filters (see ``_source_select_tail``).
 
-            cursor.execute(query, where_params)
+        Selects only the columns from ``_get_source_projection``.
+        """
+        projection = self._get_source_projection(old_table)
+        select_list = ', '.join(_quote_ident(c) for c in projection) if projection else '*'
+        tail, params = self._source_select_tail(old_table, filters)
+        # Unbuffered cursor: rows are converted to dicts as they arrive,
+        # so the raw tuple result set is never held alongside them.  It is
+        # still drained in full because every target table replays the
+        # rows and FK lookups share this connection (``_iter_source_chunks``
+        # covers the cases where neither holds).
+        with self.source_conn.cursor(pymysql.cursors.SSDictCursor) as cursor:
+            cursor.execute(f"SELECT {select_list}{tail}", params)
             rows = cursor.fetchall()
             
             return rows if rows else []
+
+    # Rows handed to ``_migrate_to_target`` at a time when streaming
+    _STREAM_CHUNK_ROWS = 5000
+
+    def _can_stream(self, target_db: str, field_list: List[FieldTarget]) -> bool:
+        """Whether rows for this target can be consumed while the source
+        query is still open.
+
+        An unbuffered result blocks its connection, so the target must be
+        written through its own connection and no field may look values up
+        in the source database mid-stream.
+        """
+        if self._target_conn(target_db) is self.source_conn:
+            return False
+        return not any(field.lookup_chain for field in field_list)
+
+    def _iter_source_chunks(self, old_table: str, filters: Optional[Dict]):
+        """Like ``_fetch_source_data``, but yields ``_STREAM_CHUNK_ROWS``
+        rows at a time from the open unbuffered cursor."""
+        projection = self._get_source_projection(old_table)
+        select_list = ', '.join(_quote_ident(c) for c in projection) if projection else '*'
+        tail, params = self._source_select_tail(old_table, filters)
+        with self.source_conn.cursor(pymysql.cursors.SSDictCursor) as cursor:
+            cursor.execute(f"SELECT {select_list}{tail}", params)
+            while True:
+                rows = cursor.fetchmany(self._STREAM_CHUNK_ROWS)
+                if not rows:
+                    break
+                yield rows
     
-    def _group_targets(self, field_mappings: Dict, target_db_type: str) -> Dict[str, List]:
+    def _get_ordered_targets(self, old_table: str, target_db_type: str) -> List[Tuple[str, List[FieldTarget]]]:
+        """``(target_table, field_list)`` pairs for one source table and DB
+        type, in FK dependency order.
+
+        The mappings don't change during a run, so the grouping and sort
+        are done once per ``(old_table, target_db_type)`` and reused for
+        every site.
+        """
+        key = (old_table, target_db_type)
+        ordered = self._ordered_targets_cache.get(key)
+        if ordered is None:
+            target_groups = self._group_targets(self.mappings[old_table], target_db_type)
+            ordered = [
+                (target_table, target_groups[target_table])
+                for target_table in self._sort_targets_by_dependency(list(target_groups.keys()))
+            ]
+            self._ordered_targets_cache[key] = ordered
+        return ordered
+
+    def _group_targets(self, field_mappings: Dict, target_db_type: str) -> Dict[str, List[FieldTarget]]:
         """
-        Group field targets by target table.
+        Group field targets (as ``FieldTarget``) by target table.
         Handles BOTH old and new mapping formats:
         - Old: {"target": "table.column"}
         - New: {"targets": [{"db": "tenant", "table": "...", "column": "..."}]}
@@ -416,13 +742,13 @@ class MigrationExecutor:
                     if target_table not in target_groups:
                         target_groups[target_table] = []
                     
-                    target_groups[target_table].append({
-                        'old_field': old_field,
-                        'new_field': target['column'],
-                        'sql': target.get('sql'),
-                        'condition': target.get('condition'),
-                        'lookup_chain': target.get('lookup_chain')
-                    })
+                    target_groups[target_table].append(FieldTarget(
+                        old_field=old_field,
+                        new_field=target['column'],
+                        sql=target.get('sql'),
+                        condition=target.get('condition'),
+                        lookup_chain=target.get('lookup_chain')
+                    ))
             
             # Handle OLD format: {"target": "table.column"}
             elif 'target' in mapping:
@@ -437,13 +763,13 @@ class MigrationExecutor:
                     if target_table not in target_groups:
                         target_groups[target_table] = []
                     
-                    target_groups[target_table].append({
-                        'old_field': old_field,
-                        'new_field': target_column,
-                        'sql': mapping.get('sql'),
-                        'condition': mapping.get('condition'),
-                        'lookup_chain': mapping.get('lookup_chain')
-                    })
+                    target_groups[target_table].append(FieldTarget(
+                        old_field=old_field,
+                        new_field=target_column,
+                        sql=mapping.get('sql'),
+                        condition=mapping.get('condition'),
+                        lookup_chain=mapping.get('lookup_chain')
+                    ))
         
         return target_groups
     
@@ -495,7 +821,7 @@ class MigrationExecutor:
         key = f"{db_name}.{table_name}.{column_name}"
         if key not in self._column_exists_cache:
             try:
-                cursor.execute(f"SHOW COLUMNS FROM `{db_name}`.`{table_name}` LIKE %s", (column_name,))
+                cursor.execute(f"SHOW COLUMNS FROM {_qualified(db_name, table_name)} LIKE %s", (column_name,))
                 self._column_exists_cache[key] = cursor.fetchone() is not None
             except Exception:
                 self._column_exists_cache[key] = False
@@ -514,9 +840,8 @@ class MigrationExecutor:
         unique_constraints = []
         
         try:
-            with self.source_conn.cursor(pymysql.cursors.DictCursor) as cursor:
-                cursor.execute(f"USE `{db_name}`")
-                cursor.execute(f"""
+            with self._target_conn(db_name).cursor(pymysql.cursors.DictCursor) as cursor:
+                cursor.execute("""
                     SELECT 
                         INDEX_NAME,
                         GROUP_CONCAT(COLUMN_NAME ORDER BY SEQ_IN_INDEX) as columns
@@ -548,7 +873,9 @@ class MigrationExecutor:
 
     def _get_fk_source_tables(self) -> frozenset:
         """Return the set of target table names that appear in any
-        ``lookup_chain[].new_table`` across all mappings.
+        ``lookup_chain[].new_table`` across all mappings, plus ``user``
+        when any target column is ``user_id`` (resolved from
+        ``id_mappings['user']['username']``).
 
         These tables need per-row INSERT so their auto-increment IDs
         can be cached for downstream FK resolution.  All other tables
@@ -564,7 +891,11 @@ class MigrationExecutor:
             for _field, mapping in field_mappings.items():
                 if not isinstance(mapping, dict):
                     continue
+                if str(mapping.get('target') or '').endswith('.user_id'):
+                    fk_tables.add('user')
                 for target in mapping.get('targets', []):
+                    if target.get('column') == 'user_id':
+                        fk_tables.add('user')
                     for step in (target.get('lookup_chain') or []):
                         nt = step.get('new_table')
                         if nt:
@@ -573,64 +904,79 @@ class MigrationExecutor:
         return self._fk_source_cache
 
     # ────────────────────────────────────────────────────────────
-    # Prepare a single row's insert_data dict
+    # Compile a target's row -> insert_data function
     # ────────────────────────────────────────────────────────────
 
-    def _prepare_insert_data(
+    def _build_values_fn(
         self,
-        row: Dict,
-        field_list: List[Dict],
+        field_list: List[FieldTarget],
         old_table: str,
         target_table: str,
         target_db: str,
         site_info: Dict,
         site_uuid: str,
-        cursor,
-    ) -> Optional[Dict]:
-        """Build the column→value dict for one source row.
-
-        Returns ``None`` when the row should be skipped (empty data).
+    ) -> Callable[[Dict], Optional[Dict]]:
+        """Generate one ``row -> insert_data`` function for a target.
+
+        Plain copies become ``row.get(...)`` and transforms/conditions are
+        called as pre-compiled closures, so a row costs one call instead
+        of a ``_get_field_value`` dispatch per field.  Fields with a lookup
+        chain or ``user_id`` resolution still go through
+        ``_get_field_value``.
+
+        ``site_uuid`` / ``site_name`` are filled in when the target table
+        has those columns (checked here, once per target).  The function
+        returns ``None`` when the row should be skipped (empty data).
         """
-        insert_data: Dict[str, Any] = {}
-
-        for field_info in field_list:
-            old_field = field_info['old_field']
-            new_field = field_info['new_field']
-            sql_transform = field_info.get('sql')
-            condition = field_info.get('condition')
-            lookup_chain = field_info.get('lookup_chain')
-
-            if condition and not self._eval_condition(condition, row):
-                continue
-
-            value = self._get_field_value(
-                row=row,
-                old_field=old_field,
-                new_field=new_field,
-                sql_transform=sql_transform,
-                old_table=old_table,
-                target_table=target_table,
-                target_db=target_db,
-                site_info=site_info,
-                lookup_chain=lookup_chain,
-            )
-            insert_data[new_field] = value
-
-        if not insert_data:
-            return None
+        lines = ["def values(row):", "    d = {}"]
+        namespace: Dict[str, Any] = {}
+        for i, field_info in enumerate(field_list):
+            sql_transform = field_info.sql
+            if field_info.lookup_chain or field_info.new_field == 'user_id':
+                namespace[f'_v{i}'] = functools.partial(
+                    self._get_field_value,
+                    old_field=field_info.old_field,
+                    new_field=field_info.new_field,
+                    sql_transform=sql_transform,
+                    old_table=old_table,
+                    target_table=target_table,
+                    target_db=target_db,
+                    site_info=site_info,
+                    lookup_chain=field_info.lookup_chain,
+                )
+                expr = f"_v{i}(row)"
+            elif (not sql_transform or not isinstance(sql_transform, str)
+                    or 'INSERT INTO' in sql_transform.upper()):
+                expr = f"row.get({field_info.old_field!r})"
+            else:
+                namespace[f'_v{i}'] = self._get_compiled_transform(sql_transform)
+                expr = f"_v{i}(row)"
+
+            assign = f"d[{field_info.new_field!r}] = {expr}"
+            if field_info.condition and isinstance(field_info.condition, str):
+                namespace[f'_c{i}'] = self._get_compiled_condition(field_info.condition)
+                lines.append(f"    if _c{i}(row):")
+                lines.append(f"        {assign}")
+            else:
+                lines.append(f"    {assign}")
+        lines.append("    if not d:")
+        lines.append("        return None")
 
         # Add site_uuid / site_name when the target table expects them
-        if 'site_uuid' not in insert_data:
+        with self._target_conn(target_db).cursor() as cursor:
             if self._has_column(cursor, target_db, target_table, 'site_uuid'):
-                insert_data['site_uuid'] = site_uuid
-
-        if 'site_name' not in insert_data or insert_data.get('site_name') is None:
-            if self._has_column(cursor, target_db, target_table, 'site_name'):
-                site_name_value = site_info.get('siteName', '')
-                if site_name_value:
-                    insert_data['site_name'] = site_name_value
-
-        return insert_data
+                namespace['_site_uuid'] = site_uuid
+                lines.append("    if 'site_uuid' not in d:")
+                lines.append("        d['site_uuid'] = _site_uuid")
+            site_name_value = site_info.get('siteName', '')
+            if site_name_value and self._has_column(cursor, target_db, target_table, 'site_name'):
+                namespace['_site_name'] = site_name_value
+                lines.append("    if d.get('site_name') is None:")
+                lines.append("        d['site_name'] = _site_name")
+        lines.append("    return d")
+
+        exec(compile("\n".join(lines) + "\n", f"<values {target_table}>", "exec"), namespace)
+        return namespace['values']
 
     # ────────────────────────────────────────────────────────────
     # Main entry point — chooses batch vs row-by-row
@@ -641,31 +987,36 @@ class MigrationExecutor:
         old_table: str,
         target_db: str,
         target_table: str,
-        field_list: List[Dict],
+        field_list: List[FieldTarget],
         source_rows: List[Dict],
         site_uuid: str,
-        site_info: Dict
+        site_info: Dict,
+        values_fn: Optional[Callable[[Dict], Optional[Dict]]] = None,
+        rows_before: Optional[int] = None,
     ) -> int:
         """Migrate rows to a specific target table.
 
-        Automatically uses **batch INSERT** (via ``executemany``) for
-        large tables whose IDs are not referenced by downstream FK
-        chains, and falls back to row-by-row INSERT otherwise.
+        Uses **batch INSERT** (via ``executemany``) for every table whose
+        IDs are not referenced by downstream FK chains, and row-by-row
+        INSERT (to capture ``lastrowid``) for the ones that are.
+
+        When streaming, the caller passes the target's ``values_fn`` (built
+        once for all chunks) and ``rows_before``, the rows already written
+        for this target, which the progress log counts from.
         """
         if not source_rows:
             return 0
 
         # Phase 1 — prepare every row's insert_data
         prepared: List[Tuple[Dict, Dict]] = []  # (source_row, insert_data)
-        with self.source_conn.cursor() as cursor:
-            cursor.execute(f"USE `{target_db}`")
-            for row in source_rows:
-                data = self._prepare_insert_data(
-                    row, field_list, old_table, target_table,
-                    target_db, site_info, site_uuid, cursor,
-                )
-                if data is not None:
-                    prepared.append((row, data))
+        if values_fn is None:
+            values_fn = self._build_values_fn(
+                field_list, old_table, target_table, target_db, site_info, site_uuid,
+            )
+        for row in source_rows:
+            data = values_fn(row)
+            if data is not None:
+                prepared.append((row, data))
 
         if not prepared:
             return 0
@@ -673,15 +1024,137 @@ class MigrationExecutor:
         # Phase 2 — choose strategy
         needs_id_cache = target_table in self._get_fk_source_tables()
 
-        if needs_id_cache or len(prepared) <= 20:
+        if needs_id_cache:
             return self._insert_rows_individually(
                 old_table, target_db, target_table, prepared,
             )
         else:
             return self._insert_rows_batch(
-                old_table, target_db, target_table, prepared,
+                old_table, target_db, target_table, prepared, rows_before,
             )
 
+    # ────────────────────────────────────────────────────────────
+    # Server-side INSERT ... SELECT  (opt-in via ``push_down``)
+    # ────────────────────────────────────────────────────────────
+
+    def _on_source_server(self, target_db: str) -> bool:
+        """True when *target_db* is reachable from the source server."""
+        if target_db not in self._same_server_cache:
+            conn = self._target_conn(target_db)
+            same = conn is self.source_conn
+            if not same:
+                try:
+                    identity = []
+                    for c in (self.source_conn, conn):
+                        with c.cursor(pymysql.cursors.Cursor) as cursor:
+                            cursor.execute("SELECT @@hostname, @@port")
+                            identity.append(tuple(cursor.fetchone()))
+                    same = identity[0] == identity[1]
+                except Exception:
+                    same = False
+            self._same_server_cache[target_db] = same
+        return self._same_server_cache[target_db]
+
+    def _push_down_target(
+        self,
+        old_table: str,
+        target_db: str,
+        target_table: str,
+        field_list: List[FieldTarget],
+        filters: Optional[Dict],
+        site_uuid: str,
+        site_info: Dict,
+    ) -> Optional[int]:
+        """Copy one target with a single ``INSERT ... SELECT``.
+
+        Only done when the rows would come out exactly as the Python path
+        builds them: every field is a plain column (or ``SELECT col``)
+        with no condition, lookup chain or ``user_id`` resolution, the
+        target's IDs aren't needed by FK chains, and it has no unique keys
+        (so no upsert, and the row count is exact).
+
+        Returns the number of rows copied, or ``None`` to use the Python
+        path instead.
+        """
+        if target_table in self._get_fk_source_tables():
+            return None
+        if not self._on_source_server(target_db):
+            return None
+        if self._get_unique_constraints(target_db, target_table):
+            return None
+        try:
+            available = set(self._get_source_columns(self._resolve_source_table(old_table)))
+        except Exception:
+            return None
+
+        # Same column order and last-one-wins as _build_values_fn
+        exprs: Dict[str, str] = {}
+        for field in field_list:
+            if field.condition or field.lookup_chain or field.new_field == 'user_id':
+                return None
+            column = field.old_field
+            sql = field.sql
+            if sql and isinstance(sql, str) and 'INSERT INTO' not in sql.upper():
+                sql = sql.strip()
+                if sql.upper().startswith('CASE'):
+                    return None
+                match = _SELECT_COLUMN_RE.match(sql)
+                column = match.group(1) if match and sql.upper().startswith('SELECT') else sql
+            exprs[field.new_field] = _quote_ident(column) if column in available else 'NULL'
+
+        conn = self._target_conn(target_db)
+        # Bound values of the select list, by column; read back in
+        # ``exprs`` order so each lands on its own %s
+        column_params: Dict[str, Any] = {}
+        with conn.cursor() as cursor:
+            if 'site_uuid' not in exprs and self._has_column(cursor, target_db, target_table, 'site_uuid'):
+                exprs['site_uuid'] = '%s'
+                column_params['site_uuid'] = site_uuid
+            site_name_value = site_info.get('siteName', '')
+            if site_name_value and self._has_column(cursor, target_db, target_table, 'site_name'):
+                expr = exprs.get('site_name')
+                exprs['site_name'] = '%s' if expr is None else f"COALESCE({expr}, %s)"
+                column_params['site_name'] = site_name_value
+            params = [column_params[c] for c in exprs if c in column_params]
+
+            tail, where_params = self._source_select_tail(old_table, filters)
+            sql = (
+                f"INSERT INTO {_qualified(target_db, target_table)} "
+                f"({', '.join(_quote_ident(c) for c in exprs)}) "
+                f"SELECT {', '.join(exprs.values())}{tail}"
+            )
+            try:
+                cursor.execute(sql, params + where_params)
+            except Exception as e:
+                logger.warning(f"INSERT ... SELECT failed for {target_table}, copying rows instead: {e}")
+                return None
+            return cursor.rowcount
+
+    def _build_insert_sql(
+        self,
+        target_db: str,
+        target_table: str,
+        columns: Tuple[str, ...],
+        unique_constraints: List[List[str]],
+    ) -> str:
+        """INSERT statement for one column signature, upserting when the
+        target table has unique keys."""
+        sql = (
+            f"INSERT INTO {_qualified(target_db, target_table)} "
+            f"({', '.join(_quote_ident(c) for c in columns)}) "
+            f"VALUES ({', '.join(['%s'] * len(columns))})"
+        )
+
+        if unique_constraints:
+            update_cols = [c for c in columns if c not in ['id', 'created_at']]
+            if update_cols:
+                sql += " ON DUPLICATE KEY UPDATE "
+                sql += ', '.join(
+                    f'{_quote_ident(c)} = VALUES({_quote_ident(c)})' for c in update_cols
+                )
+
+        return sql
+
     # ────────────────────────────────────────────────────────────
     # Row-by-row INSERT  (original behaviour — needed for FK cache)
     # ────────────────────────────────────────────────────────────
@@ -696,36 +1169,28 @@ class MigrationExecutor:
         migrated_count = 0
         unique_constraints = self._get_unique_constraints(target_db, target_table)
 
-        with self.source_conn.cursor() as cursor:
-            cursor.execute(f"USE `{target_db}`")
+        with self._target_conn(target_db).cursor() as cursor:
+            # Rows usually share one column signature; build its SQL once.
+            sql_by_columns: Dict[Tuple[str, ...], str] = {}
 
             for row, insert_data in prepared:
                 try:
-                    columns = list(insert_data.keys())
-                    placeholders = ["%s"] * len(columns)
+                    columns = tuple(insert_data)
+                    sql = sql_by_columns.get(columns)
+                    if sql is None:
+                        sql = self._build_insert_sql(target_db, target_table, columns, unique_constraints)
+                        sql_by_columns[columns] = sql
                     values = list(insert_data.values())
 
-                    sql = f"""
-                        INSERT INTO `{target_table}`
-                        ({', '.join(f'`{c}`' for c in columns)})
-                        VALUES ({', '.join(placeholders)})
-                    """
-
-                    if unique_constraints:
-                        update_cols = [c for c in columns if c not in ['id', 'created_at']]
-                        if update_cols:
-                            sql += " ON DUPLICATE KEY UPDATE "
-                            sql += ', '.join(f'`{c}` = VALUES(`{c}`)' for c in update_cols)
-
                     cursor.execute(sql, values)
 
                     row_id = cursor.lastrowid
                     if row_id == 0 and unique_constraints:
                         for unique_cols in unique_constraints:
                             if all(col in insert_data for col in unique_cols):
-                                wc = ' AND '.join(f'`{col}` = %s' for col in unique_cols)
+                                wc = ' AND '.join(f'{_quote_ident(col)} = %s' for col in unique_cols)
                                 wv = [insert_data[col] for col in unique_cols]
-                                cursor.execute(f"SELECT id FROM `{target_table}` WHERE {wc}", wv)
+                                cursor.execute(f"SELECT id FROM {_qualified(target_db, target_table)} WHERE {wc}", wv)
                                 result = cursor.fetchone()
                                 if result:
                                     row_id = result[0]
@@ -744,8 +1209,6 @@ class MigrationExecutor:
                         'error': str(e)[:300],
                     })
 
-            self.source_conn.commit()
-
         return migrated_count
 
     # ────────────────────────────────────────────────────────────
@@ -760,12 +1223,14 @@ class MigrationExecutor:
         target_db: str,
         target_table: str,
         prepared: List[Tuple[Dict, Dict]],
+        rows_before: Optional[int] = None,
     ) -> int:
         """Multi-value INSERT via ``executemany`` — dramatically reduces
         network round-trips for large tables whose IDs are not consumed
-        by downstream FK chains."""
-        from collections import defaultdict
+        by downstream FK chains.
 
+        ``rows_before`` is set when *prepared* is one streamed chunk; the
+        progress log then reports the running total for the table."""
         # Group rows by their column signature so each batch has a
         # uniform INSERT statement.
         groups: Dict[Tuple[str, ...], List[Tuple[Dict, Dict]]] = defaultdict(list)
@@ -777,23 +1242,11 @@ class MigrationExecutor:
         migrated_count = 0
         total_rows = len(prepared)
 
-        with self.source_conn.cursor() as cursor:
-            cursor.execute(f"USE `{target_db}`")
-
+        with self._target_conn(target_db).cursor() as cursor:
             for col_key, rows_in_group in groups.items():
                 columns = list(col_key)
 
-                sql = (
-                    f"INSERT INTO `{target_table}` "
-                    f"({', '.join(f'`{c}`' for c in columns)}) "
-                    f"VALUES ({', '.join(['%s'] * len(columns))})"
-                )
-
-                if unique_constraints:
-                    update_cols = [c for c in columns if c not in ['id', 'created_at']]
-                    if update_cols:
-                        sql += " ON DUPLICATE KEY UPDATE "
-                        sql += ', '.join(f'`{c}` = VALUES(`{c}`)' for c in update_cols)
+                sql = self._build_insert_sql(target_db, target_table, columns, unique_constraints)
 
                 # Build value tuples
                 value_tuples = [
@@ -801,6 +1254,13 @@ class MigrationExecutor:
                     for _row, data in rows_in_group
                 ]
 
+                # Opt-in: the whole group as one LOAD DATA statement
+                if self.bulk_load and not unique_constraints:
+                    loaded = self._load_data(cursor, target_db, target_table, columns, value_tuples)
+                    if loaded is not None:
+                        migrated_count += loaded
+                        continue
+
                 # Execute in chunks
                 for i in range(0, len(value_tuples), self._BATCH_SIZE):
                     chunk = value_tuples[i : i + self._BATCH_SIZE]
@@ -832,14 +1292,80 @@ class MigrationExecutor:
                                 })
 
                     # Log progress for large tables
-                    if total_rows > 100 and migrated_count > 0:
+                    if rows_before is not None:
+                        if migrated_count > 0:
+                            logger.info(
+                                f"  … {target_table}: {rows_before + migrated_count} rows"
+                            )
+                    elif total_rows > 100 and migrated_count > 0:
                         logger.info(
                             f"  … {target_table}: {migrated_count}/{total_rows} rows"
                         )
 
-            self.source_conn.commit()
-
         return migrated_count
+
+    # ────────────────────────────────────────────────────────────
+    # LOAD DATA  (opt-in via ``bulk_load``)
+    # ────────────────────────────────────────────────────────────
+
+    # Value types written to the load file; anything else (bytes,
+    # timedelta, ...) keeps the group on the INSERT path.
+    _LOAD_DATA_TYPES = (str, int, float, Decimal, date)
+
+    def _load_data(
+        self,
+        cursor,
+        target_db: str,
+        target_table: str,
+        columns: List[str],
+        value_tuples: List[Tuple],
+    ) -> Optional[int]:
+        """Load rows through a temporary tab-separated file.
+
+        Returns the number of rows loaded, or ``None`` when the rows
+        can't be loaded this way and the caller should INSERT them.
+        With LOCAL, MySQL skips duplicate-key rows with a warning instead
+        of failing, so those rows don't reach ``skipped_rows``.
+        """
+        lines = []
+        for values in value_tuples:
+            fields = []
+            for value in values:
+                if value is None:
+                    fields.append('\\N')
+                    continue
+                if isinstance(value, bool):
+                    value = int(value)
+                elif not isinstance(value, self._LOAD_DATA_TYPES):
+                    return None
+                if isinstance(value, datetime):
+                    # Same format PyMySQL uses for datetime parameters
+                    fmt = '%Y-%m-%d %H:%M:%S.%f' if value.microsecond else '%Y-%m-%d %H:%M:%S'
+                    value = value.strftime(fmt)
+                fields.append(
+                    str(value).replace('\\', '\\\\').replace('\t', '\\t')
+                    .replace('\n', '\\n').replace('\r', '\\r').replace('\0', '\\0')
+                )
+            lines.append('\t'.join(fields))
+
+        fd, path = tempfile.mkstemp(prefix='schema-migrator-', suffix='.tsv')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8', newline='\n') as f:
+                f.write('\n'.join(lines))
+                f.write('\n')
+            cursor.execute(
+                f"LOAD DATA LOCAL INFILE %s INTO TABLE {_qualified(target_db, target_table)} "
+                f"CHARACTER SET utf8mb4 "
+                f"FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' LINES TERMINATED BY '\\n' "
+                f"({', '.join(_quote_ident(c) for c in columns)})",
+                (path,),
+            )
+            return cursor.rowcount
+        except Exception as e:
+            logger.warning(f"LOAD DATA failed for {target_table}, using INSERT: {e}")
+            return None
+        finally:
+            os.unlink(path)
     
     def _get_field_value(
         self,
@@ -906,93 +1432,127 @@ class MigrationExecutor:
         - Simple column references
         - NULL
         - Literal values
+
+        Each distinct expression is parsed once by ``_compile_sql_transform``;
+        later rows only call the cached closure.
         """
         if not sql_transform or not isinstance(sql_transform, str):
             return None
-        
+
+        return self._get_compiled_transform(sql_transform)(row)
+
+    def _get_compiled_transform(self, sql_transform: str) -> Callable[[Dict], Any]:
+        """Cached ``_compile_sql_transform``."""
+        compiled = self._transform_cache.get(sql_transform)
+        if compiled is None:
+            compiled = self._compile_sql_transform(sql_transform)
+            self._transform_cache[sql_transform] = compiled
+        return compiled
+
+    def _compile_sql_transform(self, sql_transform: str) -> Callable[[Dict], Any]:
+        """Parse a ``sql`` transform into a ``row -> value`` callable."""
         sql = sql_transform.strip()
         
         # Handle CASE WHEN statements
         if sql.upper().startswith('CASE'):
-            return self._eval_case_statement(sql, row)
+            return self._compile_case_statement(sql)
         
         # Handle simple SELECT statements (extract just the column reference)
         if sql.upper().startswith('SELECT'):
             # Extract column name: "SELECT username FROM table WHERE..." -> "username"
-            match = re.match(r'SELECT\s+(\w+)', sql, re.IGNORECASE)
+            match = _SELECT_COLUMN_RE.match(sql)
             if match:
                 col_name = match.group(1)
-                return row.get(col_name)
+                return lambda row: row.get(col_name)
         
         # Handle direct column references
-        return row.get(sql)
+        return lambda row: row.get(sql)
     
-    def _eval_case_statement(self, sql: str, row: Dict) -> Any:
-        """Evaluate CASE WHEN statement."""
+    def _compile_case_statement(self, sql: str) -> Callable[[Dict], Any]:
+        """Compile a CASE WHEN statement."""
         # Extract WHEN clauses
-        pattern = r'WHEN\s+(.+?)\s+THEN\s+(.+?)(?:\s+WHEN|\s+ELSE|\s+END)'
-        matches = re.findall(pattern, sql, re.IGNORECASE | re.DOTALL)
-        
-        for condition, value in matches:
-            if self._eval_condition(condition.strip(), row):
-                return self._eval_value(value.strip(), row)
+        branches = [
+            (self._compile_condition(condition.strip()), self._compile_value(value.strip()))
+            for condition, value in _CASE_WHEN_RE.findall(sql)
+        ]
         
         # Handle ELSE clause
-        else_match = re.search(r'ELSE\s+(.+?)\s+END', sql, re.IGNORECASE | re.DOTALL)
-        if else_match:
-            return self._eval_value(else_match.group(1).strip(), row)
-        
-        return None
+        else_match = _CASE_ELSE_RE.search(sql)
+        otherwise = self._compile_value(else_match.group(1).strip()) if else_match else None
+
+        def case(row):
+            for condition, value in branches:
+                if condition(row):
+                    return value(row)
+            return otherwise(row) if otherwise else None
+
+        return case
     
     def _eval_condition(self, condition: str, row: Dict) -> bool:
         """Evaluate a SQL condition."""
         if not condition or not isinstance(condition, str):
             return True  # No condition means always include
-        
+        return self._get_compiled_condition(condition)(row)
+
+    def _get_compiled_condition(self, condition: str) -> Callable[[Dict], bool]:
+        """Cached ``_compile_condition``."""
+        compiled = self._condition_cache.get(condition)
+        if compiled is None:
+            compiled = self._compile_condition(condition)
+            self._condition_cache[condition] = compiled
+        return compiled
+
+    def _compile_condition(self, condition: str) -> Callable[[Dict], bool]:
+        """Compile a SQL condition into a ``row -> bool`` callable."""
         # Handle = comparison
         if ' = ' in condition:
             parts = condition.split(' = ', 1)
-            left = self._eval_value(parts[0].strip(), row)
-            right = self._eval_value(parts[1].strip(), row)
-            return str(left) == str(right)
+            left = self._compile_value(parts[0].strip())
+            right = self._compile_value(parts[1].strip())
+            return lambda row: str(left(row)) == str(right(row))
         
         # Handle != or <> comparison
         if ' != ' in condition or ' <> ' in condition:
             sep = ' != ' if ' != ' in condition else ' <> '
             parts = condition.split(sep, 1)
-            left = self._eval_value(parts[0].strip(), row)
-            right = self._eval_value(parts[1].strip(), row)
-            return str(left) != str(right)
+            left = self._compile_value(parts[0].strip())
+            right = self._compile_value(parts[1].strip())
+            return lambda row: str(left(row)) != str(right(row))
         
         # Handle IS NULL
         if 'IS NULL' in condition.upper():
             col = condition.replace('IS NULL', '').replace('is null', '').strip()
             col = col.replace('ss.', '').replace('`', '')
-            return row.get(col) is None
+            return lambda row: row.get(col) is None
         
-        return False
+        return lambda row: False
     
     def _eval_value(self, value: str, row: Dict) -> Any:
         """Evaluate a SQL value expression."""
+        return self._compile_value(value)(row)
+
+    def _compile_value(self, value: str) -> Callable[[Dict], Any]:
+        """Compile a SQL value expression into a ``row -> value`` callable."""
         value = value.strip()
         
         # Handle NULL
         if value.upper() == 'NULL':
-            return None
+            return lambda row: None
         
         # Handle quoted strings
         if (value.startswith("'") and value.endswith("'")) or (value.startswith('"') and value.endswith('"')):
-            return value[1:-1]
+            literal = value[1:-1]
+            return lambda row: literal
         
         # Handle table-prefixed column references (ss.field -> field)
         if '.' in value:
             value = value.split('.')[-1]
         
         # Remove backticks
-        value = value.replace('`', '')
+        name = value.replace('`', '')
         
         # Try to get from row
-        return row.get(value, value)
+        return lambda row: row.get(name, name)
     
     def _cache_id_mapping(
         self,
@@ -1137,9 +1697,9 @@ class MigrationExecutor:
         """Look up a value in the old schema."""
         try:
             with self.source_conn.cursor(pymysql.cursors.DictCursor) as cursor:
-                cursor.execute(f"USE `{self.source_db}`")
                 cursor.execute(
-                    f"SELECT * FROM `{table}` WHERE `{lookup_column}` = %s LIMIT 1",
+                    f"SELECT * FROM {_qualified(self.source_db, table)} "
+                    f"WHERE {_quote_ident(lookup_column)} = %s LIMIT 1",
                     (lookup_value,)
                 )
                 result = cursor.fetchone()
@@ -1161,10 +1721,10 @@ class MigrationExecutor:
         """Look up an ID in the new schema."""
         try:
             # Explicitly use plain Cursor (not DictCursor) so result[0] works
-            with self.source_conn.cursor(pymysql.cursors.Cursor) as cursor:
-                cursor.execute(f"USE `{target_db}`")
+            with self._target_conn(target_db).cursor(pymysql.cursors.Cursor) as cursor:
                 cursor.execute(
-                    f"SELECT `id` FROM `{table}` WHERE `{lookup_column}` = %s LIMIT 1",
+                    f"SELECT `id` FROM {_qualified(target_db, table)} "
+                    f"WHERE {_quote_ident(lookup_column)} = %s LIMIT 1",
                     (lookup_value,)
                 )
                 result = cursor.fetchone()